@@ -0,0 +1,93 @@
+"""Microbenchmark of the per-update CPU cost of Execution, Task and Step
+
+Measures only the SDK side of an update (model mutation, validation and dump),
+using a client that discards the payloads instead of sending them.
+
+Run from the repository root with the package installed.
+
+Usage:
+    python benchmarks/bench_models.py [--iterations N]
+"""
+from zsynctech_studio_sdk.validation import validate_iso_timestamp, validate_uuid7
+from zsynctech_studio_sdk.utils import get_utc_now
+from zsynctech_studio_sdk import Execution, Task, Step
+from uuid_extensions import uuid7
+import argparse
+import time
+
+
+class NullClient:
+    instance_id = str(uuid7())
+    instrumentation = None
+    step_profiler = None
+
+    def submit(self, endpoint: str, json: dict = None, must_deliver: bool = False):
+        pass
+
+    def flush(self, wait: bool = True, timeout: float = None) -> bool:
+        return True
+
+
+def bench_task_step_cycle(iterations: int) -> float:
+    client = NullClient()
+    execution_id = str(uuid7())
+    started = time.perf_counter()
+    for _ in range(iterations):
+        with Task(execution_id, client=client) as task:
+            with Step(task.task_id, "STEP", client=client):
+                pass
+    return (time.perf_counter() - started) / iterations
+
+
+def bench_execution_update(iterations: int) -> float:
+    execution = Execution(str(uuid7()), client=NullClient())
+    execution.set_total_task_count(iterations)
+    started = time.perf_counter()
+    for current in range(iterations):
+        execution.update_current_task_count(current)
+    return (time.perf_counter() - started) / iterations
+
+
+def bench_task_update(iterations: int) -> float:
+    task = Task(str(uuid7()), client=NullClient())
+    started = time.perf_counter()
+    for _ in range(iterations):
+        task.start()
+    return (time.perf_counter() - started) / iterations
+
+
+def bench_validate_repeated_id(iterations: int) -> float:
+    execution_id = str(uuid7())
+    started = time.perf_counter()
+    for _ in range(iterations):
+        validate_uuid7(execution_id)
+    return (time.perf_counter() - started) / iterations
+
+
+def bench_validate_timestamp(iterations: int) -> float:
+    timestamp = get_utc_now()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        validate_iso_timestamp(timestamp, "startDate")
+    return (time.perf_counter() - started) / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    benchmarks = {
+        "task+step cycle (4 updates)": bench_task_step_cycle,
+        "task update": bench_task_update,
+        "execution update": bench_execution_update,
+        "validate repeated id": bench_validate_repeated_id,
+        "validate timestamp": bench_validate_timestamp,
+    }
+    for name, bench in benchmarks.items():
+        best = min(bench(args.iterations) for _ in range(3))
+        print(f"{name:<30} {best * 1e6:8.2f} us/op")
+
+
+if __name__ == "__main__":
+    main()
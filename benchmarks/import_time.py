@@ -0,0 +1,73 @@
+"""Import-time benchmark of the SDK entry points
+
+Imports each entry point in fresh interpreters and reports the median wall
+time, and fails if an entry point loads modules it must not need (e.g. a
+Task-only robot importing pika).
+
+Run from the repository root with the package installed.
+
+Usage:
+    python benchmarks/import_time.py [--runs N] [--max-ms MS]
+"""
+import statistics
+import subprocess
+import argparse
+import json
+import sys
+
+SCENARIOS = {
+    "package": (
+        "import zsynctech_studio_sdk",
+        ("pika", "aio_pika", "httpx", "pydantic"),
+    ),
+    "task_only": (
+        "from zsynctech_studio_sdk import set_credentials, Task, Step",
+        ("pika", "aio_pika", "sqlite3"),
+    ),
+    "start_service": (
+        "from zsynctech_studio_sdk import StartService",
+        ("aio_pika",),
+    ),
+}
+
+PROBE = """
+import time, sys, json
+started = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - started
+print(json.dumps({{"ms": elapsed * 1000, "loaded": [name for name in {forbidden!r} if name in sys.modules]}}))
+"""
+
+
+def measure(statement: str, forbidden: tuple[str, ...], runs: int) -> tuple[float, list[str]]:
+    timings = []
+    loaded = set()
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE.format(statement=statement, forbidden=forbidden)],
+            check=True, capture_output=True, text=True
+        ).stdout
+        result = json.loads(output)
+        timings.append(result["ms"])
+        loaded.update(result["loaded"])
+    return statistics.median(timings), sorted(loaded)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--max-ms", type=float, help="Fails if an entry point takes longer than this")
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'entry point':<16} {'median (ms)':>12}  unexpected modules")
+    for name, (statement, forbidden) in SCENARIOS.items():
+        median, loaded = measure(statement, forbidden, args.runs)
+        print(f"{name:<16} {median:>12.1f}  {', '.join(loaded) or '-'}")
+        failed = failed or bool(loaded) or (args.max_ms is not None and median > args.max_ms)
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""In-process stand-ins for the automation-gateway HTTP API and the RabbitMQ broker"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from collections import deque
+from typing import Optional
+import threading
+import json
+
+
+class _GatewayHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def _respond(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        self.server.record(self.command, self.path, body)
+        payload = b"{}"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _respond
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubGateway(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        """HTTP server on a free local port that accepts every gateway request"""
+        super().__init__(("127.0.0.1", 0), _GatewayHandler)
+        self.requests = 0
+        self.bytes_received = 0
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def record(self, method: str, path: str, body: bytes):
+        with self._lock:
+            self.requests += 1
+            self.bytes_received += len(body)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+        self.server_close()
+        return False
+
+
+class _Method:
+    def __init__(self, delivery_tag: int):
+        self.delivery_tag = delivery_tag
+
+
+class _QueueFrame:
+    def __init__(self, message_count: int):
+        self.method = self
+        self.message_count = message_count
+
+
+class StubChannel:
+    def __init__(self, connection: "StubConnection"):
+        """Channel of the AMQP stand-in, serving messages from an in-memory queue"""
+        self._connection = connection
+        self._consumers = {}
+        self._prefetch_count = 0
+        self.acked = []
+
+    @property
+    def is_open(self) -> bool:
+        return self._connection.is_open
+
+    def exchange_declare(self, *args, **kwargs):
+        pass
+
+    def queue_declare(self, *args, **kwargs):
+        return _QueueFrame(len(self._connection.queue))
+
+    def queue_bind(self, *args, **kwargs):
+        pass
+
+    def basic_qos(self, prefetch_count: int = 0, **kwargs):
+        self._prefetch_count = prefetch_count
+
+    def basic_consume(self, queue: str, on_message_callback, auto_ack: bool = False) -> str:
+        consumer_tag = f"ctag{len(self._consumers) + 1}"
+        self._consumers[consumer_tag] = on_message_callback
+        if self not in self._connection.channels:
+            self._connection.channels.append(self)
+        return consumer_tag
+
+    def basic_cancel(self, consumer_tag: str):
+        self._consumers.pop(consumer_tag, None)
+        return []
+
+    def dispatch(self):
+        for callback in list(self._consumers.values()):
+            for _ in range(self._prefetch_count or len(self._connection.queue)):
+                if not self._connection.queue:
+                    return
+                self._connection.delivery_tag += 1
+                callback(self, _Method(self._connection.delivery_tag), None, self._connection.queue.popleft())
+
+    def confirm_delivery(self):
+        pass
+
+    def basic_publish(self, exchange: str, routing_key: str, body: bytes, properties=None, mandatory: bool = False):
+        self._connection.queue.append(body)
+
+    def basic_get(self, queue: str, auto_ack: bool = False):
+        if not self._connection.queue:
+            return None, None, None
+        self._connection.delivery_tag += 1
+        return _Method(self._connection.delivery_tag), None, self._connection.queue.popleft()
+
+    def basic_ack(self, delivery_tag: int = 0, multiple: bool = False):
+        self.acked.append((delivery_tag, multiple))
+
+    def basic_nack(self, delivery_tag: int = 0, multiple: bool = False, requeue: bool = True):
+        pass
+
+    def basic_reject(self, delivery_tag: int = 0, requeue: bool = True):
+        pass
+
+    def close(self):
+        pass
+
+
+class StubConnection:
+    def __init__(self, parameters=None, messages: Optional[list[bytes]] = None):
+        """Stand-in for `pika.BlockingConnection` backed by an in-memory queue"""
+        self.queue = deque(messages or [])
+        self.delivery_tag = 0
+        self.channels = []
+        self.is_closed = False
+        self.is_open = True
+
+    def channel(self) -> StubChannel:
+        return StubChannel(self)
+
+    def process_data_events(self, time_limit: float = 0):
+        for channel in self.channels:
+            channel.dispatch()
+
+    def add_callback_threadsafe(self, callback):
+        callback()
+
+    def close(self):
+        self.is_closed = True
+        self.is_open = False
+
+
+def start_message(instance_id: str, execution_id: str) -> bytes:
+    """Body of a start event as published by the platform"""
+    return json.dumps({
+        "instanceId": instance_id,
+        "executionId": execution_id,
+        "automationName": "Benchmark",
+        "inputPath": "/input/data.csv",
+        "outputPath": "/output",
+        "inputMetaData": {"delimiter": ";"},
+        "keepAlive": True,
+        "keepAliveInterval": 30,
+        "credentials": [
+            {"key": "user", "value": "robot", "encrypted": False},
+            {"key": "password", "value": "c2VjcmV0", "encrypted": True},
+        ],
+    }).encode()
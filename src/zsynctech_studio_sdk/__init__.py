@@ -1,15 +1,147 @@
-from zsynctech_studio_sdk.client import set_credentials
-from zsynctech_studio_sdk.models.config import Config
-from zsynctech_studio_sdk.start import StartService
-from zsynctech_studio_sdk.execution import Execution
-from zsynctech_studio_sdk.task import Task
-from zsynctech_studio_sdk.step import Step
+from typing import TYPE_CHECKING
+import importlib
+
+if TYPE_CHECKING:
+    from zsynctech_studio_sdk.client import (
+        StudioClient,
+        set_credentials,
+        enable_dispatcher,
+        disable_dispatcher,
+        enable_outbox,
+        disable_outbox,
+        enable_instrumentation,
+        disable_instrumentation,
+        enable_step_profiling,
+        disable_step_profiling,
+        flush,
+    )
+    from zsynctech_studio_sdk.resilience import RetryPolicy, CircuitBreaker, CircuitOpenError
+    from zsynctech_studio_sdk.models.config import Config
+    from zsynctech_studio_sdk.start import StartService
+    from zsynctech_studio_sdk.execution import Execution
+    from zsynctech_studio_sdk.task import Task
+    from zsynctech_studio_sdk.step import Step
+    from zsynctech_studio_sdk.runner import TaskRunner
+    from zsynctech_studio_sdk.progress import ProgressTracker
+    from zsynctech_studio_sdk.sources import (
+        InputSource,
+        MemorySource,
+        FileSource,
+        FtpSource,
+        HttpSource,
+        QueueSource,
+        open_input,
+    )
+    from zsynctech_studio_sdk.checkpoint import CheckpointStore
+    from zsynctech_studio_sdk.sinks import (
+        OutputSink,
+        MemorySink,
+        FileSink,
+        FtpSink,
+        HttpSink,
+        QueueSink,
+        open_output,
+    )
+    from zsynctech_studio_sdk.aio import AsyncExecution, AsyncTask, AsyncStep, AsyncStartService
+
+# Public names are imported on first access, so a robot that only uses Task
+# and Step never loads pika, aio-pika or the models it does not need.
+_LAZY_IMPORTS = {
+    "StudioClient": "zsynctech_studio_sdk.client",
+    "set_credentials": "zsynctech_studio_sdk.client",
+    "enable_dispatcher": "zsynctech_studio_sdk.client",
+    "disable_dispatcher": "zsynctech_studio_sdk.client",
+    "enable_outbox": "zsynctech_studio_sdk.client",
+    "disable_outbox": "zsynctech_studio_sdk.client",
+    "enable_instrumentation": "zsynctech_studio_sdk.client",
+    "disable_instrumentation": "zsynctech_studio_sdk.client",
+    "enable_step_profiling": "zsynctech_studio_sdk.client",
+    "disable_step_profiling": "zsynctech_studio_sdk.client",
+    "flush": "zsynctech_studio_sdk.client",
+    "RetryPolicy": "zsynctech_studio_sdk.resilience",
+    "CircuitBreaker": "zsynctech_studio_sdk.resilience",
+    "CircuitOpenError": "zsynctech_studio_sdk.resilience",
+    "Config": "zsynctech_studio_sdk.models.config",
+    "StartService": "zsynctech_studio_sdk.start",
+    "Execution": "zsynctech_studio_sdk.execution",
+    "Task": "zsynctech_studio_sdk.task",
+    "Step": "zsynctech_studio_sdk.step",
+    "TaskRunner": "zsynctech_studio_sdk.runner",
+    "ProgressTracker": "zsynctech_studio_sdk.progress",
+    "InputSource": "zsynctech_studio_sdk.sources",
+    "MemorySource": "zsynctech_studio_sdk.sources",
+    "FileSource": "zsynctech_studio_sdk.sources",
+    "FtpSource": "zsynctech_studio_sdk.sources",
+    "HttpSource": "zsynctech_studio_sdk.sources",
+    "QueueSource": "zsynctech_studio_sdk.sources",
+    "open_input": "zsynctech_studio_sdk.sources",
+    "OutputSink": "zsynctech_studio_sdk.sinks",
+    "MemorySink": "zsynctech_studio_sdk.sinks",
+    "FileSink": "zsynctech_studio_sdk.sinks",
+    "FtpSink": "zsynctech_studio_sdk.sinks",
+    "HttpSink": "zsynctech_studio_sdk.sinks",
+    "QueueSink": "zsynctech_studio_sdk.sinks",
+    "open_output": "zsynctech_studio_sdk.sinks",
+    "CheckpointStore": "zsynctech_studio_sdk.checkpoint",
+    "AsyncExecution": "zsynctech_studio_sdk.aio",
+    "AsyncTask": "zsynctech_studio_sdk.aio",
+    "AsyncStep": "zsynctech_studio_sdk.aio",
+    "AsyncStartService": "zsynctech_studio_sdk.aio",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
+    "StudioClient",
     "set_credentials",
+    "enable_dispatcher",
+    "disable_dispatcher",
+    "enable_outbox",
+    "disable_outbox",
+    "enable_instrumentation",
+    "disable_instrumentation",
+    "enable_step_profiling",
+    "disable_step_profiling",
+    "flush",
+    "RetryPolicy",
+    "CircuitBreaker",
+    "CircuitOpenError",
     "StartService",
     "Execution",
     "Task",
     "Step",
+    "TaskRunner",
+    "ProgressTracker",
+    "InputSource",
+    "MemorySource",
+    "FileSource",
+    "FtpSource",
+    "HttpSource",
+    "QueueSource",
+    "open_input",
+    "OutputSink",
+    "MemorySink",
+    "FileSink",
+    "FtpSink",
+    "HttpSink",
+    "QueueSink",
+    "open_output",
+    "CheckpointStore",
+    "AsyncExecution",
+    "AsyncTask",
+    "AsyncStep",
+    "AsyncStartService",
     "Config"
-]
\ No newline at end of file
+]
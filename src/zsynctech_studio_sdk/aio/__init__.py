@@ -0,0 +1,39 @@
+from typing import TYPE_CHECKING
+import importlib
+
+if TYPE_CHECKING:
+    from zsynctech_studio_sdk.aio.execution import AsyncExecution
+    from zsynctech_studio_sdk.aio.start import AsyncStartService
+    from zsynctech_studio_sdk.aio.client import aclose
+    from zsynctech_studio_sdk.aio.task import AsyncTask
+    from zsynctech_studio_sdk.aio.step import AsyncStep
+
+_LAZY_IMPORTS = {
+    "AsyncExecution": "zsynctech_studio_sdk.aio.execution",
+    "AsyncStartService": "zsynctech_studio_sdk.aio.start",
+    "aclose": "zsynctech_studio_sdk.aio.client",
+    "AsyncTask": "zsynctech_studio_sdk.aio.task",
+    "AsyncStep": "zsynctech_studio_sdk.aio.step",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+__all__ = [
+    "AsyncExecution",
+    "AsyncTask",
+    "AsyncStep",
+    "AsyncStartService",
+    "aclose",
+]
@@ -0,0 +1,34 @@
+from zsynctech_studio_sdk.client import get_client
+from typing import Any
+import asyncio
+import httpx
+
+
+async def aclose():
+    """Closes the async connections of the default client"""
+    await get_client().aclose()
+
+
+async def update(entity: Any, *args, **kwargs) -> dict:
+    """Runs the status update of a sync Execution, Task or Step without blocking the event loop
+
+    The async classes share the update path of the sync ones, so their updates go
+    through the dispatcher, the outbox, the output sinks and the final flush alike.
+    """
+    return await asyncio.to_thread(entity._update, *args, **kwargs)
+
+
+async def request(method: str, endpoint: str, **kwargs) -> httpx.Response:
+    return await get_client().arequest(method, endpoint, **kwargs)
+
+async def get(endpoint: str, params: dict = None) -> httpx.Response:
+    return await request("GET", endpoint, params=params)
+
+async def post(endpoint: str, json: dict = None) -> httpx.Response:
+    return await request("POST", endpoint, json=json)
+
+async def put(endpoint: str, json: dict = None) -> httpx.Response:
+    return await request("PUT", endpoint, json=json)
+
+async def delete(endpoint: str) -> httpx.Response:
+    return await request("DELETE", endpoint)
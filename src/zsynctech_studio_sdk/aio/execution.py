@@ -0,0 +1,122 @@
+from zsynctech_studio_sdk.execution import Execution
+from zsynctech_studio_sdk.enums import ExecutionStatus
+from zsynctech_studio_sdk.client import StudioClient
+from zsynctech_studio_sdk.aio.client import update
+from typing import Optional, Any
+
+
+class AsyncExecution:
+    def __init__(self, execution_id: str, client: Optional[StudioClient] = None):
+        self._execution = Execution(execution_id, client=client)
+
+    @property
+    def execution_id(self):
+        return self._execution.execution_id
+
+    async def _update(
+            self,
+            status: Optional[ExecutionStatus] = None,
+            observation: Optional[str] = None,
+            total_task_count: Optional[int] = None,
+            current_task_count: Optional[int] = None,
+        ) -> dict:
+        return await update(self._execution, status, observation, total_task_count, current_task_count)
+
+    async def set_total_task_count(self, total_task_count: int) -> dict[str, Any]:
+        """Update the total number of tasks to be processed 
+
+        Args:
+            total_task_count (int): total number of tasks to be processed.
+
+        Returns:
+            dict: Dictionary containing the information of the current execution
+        """
+        return await self._update(total_task_count=total_task_count)
+
+    async def update_current_task_count(self, current_task_count: int) -> dict[str, Any]:
+        """Update the number of tasks currently processed
+
+        Args:
+            current_task_count (int): Number of tasks processed.
+
+        Returns:
+            dict: Dictionary containing the information of the current execution
+        """
+        return await self._update(current_task_count=current_task_count)
+
+    async def update_observation(self, observation: str) -> dict[str, Any]:
+        """Updates the execution observation text
+
+        Args:
+            observation (str): Execution observation text.
+
+        Returns:
+            dict: Dictionary containing the information of the current execution
+        """
+        return await self._update(observation=observation)
+
+    async def start(self, observation: Optional[str] = None) -> dict:
+        """Updates the execution status to running
+
+        Args:
+            observation (Optional[str], optional): Execution observation text. Defaults to None.
+
+        Returns:
+            dict: Dictionary containing the information of the current execution
+        """
+        return await self._update(ExecutionStatus.RUNNING, observation)
+
+    async def error(self, observation: Optional[str] = None) -> dict:
+        """Updates the execution status to error
+
+        Args:
+            observation (Optional[str], optional): Execution observation text. Defaults to None.
+
+        Returns:
+            dict: Dictionary containing the information of the current execution
+        """
+        return await self._update(ExecutionStatus.ERROR, observation=observation)
+
+    async def waiting(self, observation: Optional[str] = None) -> dict:
+        """Updates the execution status to waiting
+
+        Args:
+            observation (Optional[str], optional): Execution observation text. Defaults to None.
+
+        Returns:
+            dict: Dictionary containing the information of the current execution
+        """
+        return await self._update(ExecutionStatus.WAITING, observation=observation)
+
+    async def out_of_operating_hours(self, observation: Optional[str] = None) -> dict:
+        """Updates the execution status to out_of_operating_hours
+
+        Args:
+            observation (Optional[str], optional): Execution observation text. Defaults to None.
+
+        Returns:
+            dict: Dictionary containing the information of the current execution
+        """
+        return await self._update(ExecutionStatus.OUT_OF_OPERATING_HOURS, observation=observation)
+
+    async def finished(self, observation: Optional[str] = None) -> dict:
+        """Updates the execution status to finished
+
+        Args:
+            observation (Optional[str], optional): Execution observation text. Defaults to None.
+
+        Returns:
+            dict: Dictionary containing the information of the current execution
+        """
+        return await self._update(ExecutionStatus.FINISHED, observation=observation)
+
+    async def interrupted(self, observation: Optional[str] = None) -> dict:
+        """Updates the execution status to finished
+
+        Args:
+            observation (Optional[str], optional): Execution observation text. Defaults to None.
+
+        Returns:
+            dict: Dictionary containing the information of the current execution
+        """
+        return await self._update(ExecutionStatus.INTERRUPTED, observation=observation)
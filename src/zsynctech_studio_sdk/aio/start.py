@@ -0,0 +1,124 @@
+from zsynctech_studio_sdk.start import EXCHANGE_NAME, StartService
+from zsynctech_studio_sdk.client import StudioClient, get_client
+from zsynctech_studio_sdk.utils import validate_id_format
+from zsynctech_studio_sdk.models import Config
+from typing import AsyncIterator, Optional
+
+
+def _import_aio_pika():
+    try:
+        import aio_pika
+    except ImportError:
+        raise ImportError(
+            "AsyncStartService requires aio-pika. Install it with: pip install \"zsynctech-studio-sdk[aio]\""
+        ) from None
+    return aio_pika
+
+
+class AsyncStartService:
+    def __init__(
+            self,
+            rabbitmq_url: str,
+            heartbeat: int = 60,
+            prefetch_count: int = 1,
+            client: Optional[StudioClient] = None,
+        ):
+        """Asyncio consumer of start events
+
+        The connection is re-established automatically after broker restarts or
+        network failures, restoring the exchange, queue, binding and consumer.
+
+        Args:
+            rabbitmq_url (str): RabbitMQ connection url.
+            heartbeat (int, optional): Heartbeat interval in seconds. Defaults to 60.
+            prefetch_count (int, optional): Maximum number of events delivered and not
+            yet acknowledged. Defaults to 1.
+            client (Optional[StudioClient], optional): Client of the robot instance. Defaults to None.
+        """
+        self._instance_id = validate_id_format(get_client(client).instance_id)
+        self._queue_name = f"robot_{self._instance_id}"
+        self._rabbitmq_url = rabbitmq_url
+        self._heartbeat = heartbeat
+        self._prefetch_count = prefetch_count
+        self._connection = None
+        self._queue = None
+
+    async def connect(self):
+        """Connects to the broker and declares the exchange, queue and binding"""
+        aio_pika = _import_aio_pika()
+        self._connection = await aio_pika.connect_robust(
+            f"{self._rabbitmq_url}?heartbeat={self._heartbeat}"
+        )
+        channel = await self._connection.channel()
+        await channel.set_qos(prefetch_count=self._prefetch_count)
+
+        exchange = await channel.declare_exchange(
+            EXCHANGE_NAME,
+            aio_pika.ExchangeType.DIRECT,
+            durable=True
+        )
+        self._queue = await channel.declare_queue(
+            self._queue_name,
+            durable=True
+        )
+        await self._queue.bind(
+            exchange,
+            routing_key=f"instance.{self._instance_id}"
+        )
+
+    async def events(self) -> AsyncIterator[Config]:
+        """Iterates over the start events
+
+        An event is acknowledged only when the loop asks for the next one. The
+        current event returns to the queue when the loop exits early (`break`,
+        an exception or a cancellation of the consuming task), so an event is
+        never lost, but one whose loop exits after processing it is delivered
+        again. Events still buffered are returned to the queue by the broker.
+
+        Yields:
+            Config: Configuration of each start event
+        """
+        if self._queue is None:
+            await self.connect()
+
+        print(f"[AsyncStartService] Waiting for events in queue: {self._queue_name}...")
+
+        async with self._queue.iterator() as queue_iter:
+            async for message in queue_iter:
+                try:
+                    config = StartService._parse_config(message.body)
+                except Exception as e:
+                    print(f"[AsyncStartService] Discarding invalid event: {e}")
+                    await message.reject(requeue=False)
+                    continue
+
+                try:
+                    yield config
+                except GeneratorExit:
+                    # The iterator may be finalized long after a cancellation, when the
+                    # event was not processed; if the reject fails, the broker returns
+                    # the unacknowledged event once the channel closes
+                    try:
+                        await message.reject(requeue=True)
+                    except Exception:
+                        pass
+                    raise
+                except BaseException:
+                    await message.reject(requeue=True)
+                    raise
+                await message.ack()
+
+    async def close(self):
+        if self._connection is not None and not self._connection.is_closed:
+            await self._connection.close()
+            print("[AsyncStartService] Connection closed.")
+        self._connection = None
+        self._queue = None
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+        return False
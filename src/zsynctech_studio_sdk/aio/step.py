@@ -0,0 +1,77 @@
+from zsynctech_studio_sdk.step import Step, STEP_STATUS_COMPLETED
+from zsynctech_studio_sdk.enums import StepStatus
+from zsynctech_studio_sdk.client import StudioClient
+from zsynctech_studio_sdk.aio.client import update
+from typing import Optional
+
+
+class AsyncStep:
+    def __init__(
+            self,
+            task_id: str,
+            code: str,
+            observation: Optional[str] = None,
+            client: Optional[StudioClient] = None,
+        ):
+        self._step = Step(
+            task_id=task_id,
+            code=code,
+            observation=observation,
+            client=client
+        )
+
+    async def _update(
+            self,
+            status: Optional[StepStatus] = None,
+            observation: Optional[str] = None,
+        ) -> dict:
+        return await update(self._step, status, observation)
+
+    async def _start(self, observation: Optional[str] = None) -> dict:
+        """Updates the step status to running
+
+        Args:
+            observation (Optional[str], optional): Step observation text. Defaults to None.
+
+        Returns:
+            dict: Dictionary containing the information of the current step
+        """
+        return await self._update(status=StepStatus.RUNNING, observation=observation)
+
+    async def fail(self, observation: Optional[str] = None) -> dict:
+        """Updates the step status to fail
+
+        Args:
+            observation (Optional[str], optional): Step observation text. Defaults to None.
+
+        Returns:
+            dict: Dictionary containing the information of the current step
+        """
+        return await self._update(status=StepStatus.FAIL, observation=observation)
+
+    async def success(self, observation: Optional[str] = None) -> dict:
+        """Updates the step status to success
+
+        Args:
+            observation (Optional[str], optional): Step observation text. Defaults to None.
+
+        Returns:
+            dict: Dictionary containing the information of the current step
+        """
+        return await self._update(status=StepStatus.SUCCESS, observation=observation)
+
+    async def __aenter__(self):
+        await self._start()
+        self._step._start_profile()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        observation = self._step._stop_profile(str(exc_value) if exc_type is not None else None)
+
+        if self._step._current_step.status not in STEP_STATUS_COMPLETED:
+            if exc_type is not None:
+                await self.fail(observation=observation)
+            else:
+                await self.success(observation=observation)
+
+        return False
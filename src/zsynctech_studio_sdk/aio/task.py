@@ -0,0 +1,78 @@
+from zsynctech_studio_sdk.task import Task, TASK_STATUS_COMPLETED
+from zsynctech_studio_sdk.enums import TaskStatus
+from zsynctech_studio_sdk.client import StudioClient
+from zsynctech_studio_sdk.aio.client import update
+from typing import Optional
+
+
+class AsyncTask:
+    def __init__(
+            self,
+            execution_id: str,
+            code: Optional[str] = None,
+            description: Optional[str] = None,
+            client: Optional[StudioClient] = None,
+        ):
+        self._task = Task(
+            execution_id=execution_id,
+            code=code,
+            description=description,
+            client=client
+        )
+
+    @property
+    def task_id(self):
+        return self._task.task_id
+
+    async def _update(
+            self,
+            status: Optional[TaskStatus] = None,
+            observation: Optional[str] = None,
+        ) -> dict:
+        return await update(self._task, status, observation)
+
+    async def start(self, observation: Optional[str] = None) -> dict:
+        """Updates the task status to running
+
+        Args:
+            observation (Optional[str], optional): Task observation text. Defaults to None.
+
+        Returns:
+            dict: Dictionary containing the information of the current task
+        """
+        return await self._update(TaskStatus.RUNNING, observation)
+
+    async def fail(self, observation: Optional[str] = None) -> dict:
+        """Updates the task status to fail
+
+        Args:
+            observation (Optional[str], optional): Task observation text. Defaults to None.
+
+        Returns:
+            dict: Dictionary containing the information of the current task
+        """
+        return await self._update(TaskStatus.FAIL, observation=observation)
+
+    async def success(self, observation: Optional[str] = None) -> dict:
+        """Updates the task status to success
+
+        Args:
+            observation (Optional[str], optional): Task observation text. Defaults to None.
+
+        Returns:
+            dict: Dictionary containing the information of the current task
+        """
+        return await self._update(TaskStatus.SUCCESS, observation=observation)
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        if self._task._current_task.status not in TASK_STATUS_COMPLETED:
+            if exc_type is not None:
+                await self.fail(observation=str(exc_value))
+            else:
+                await self.success()
+
+        return False
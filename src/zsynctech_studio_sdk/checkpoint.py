@@ -0,0 +1,99 @@
+from zsynctech_studio_sdk import codec
+import threading
+import re
+import os
+
+
+class CheckpointStore:
+    def __init__(self, directory: str = "checkpoints", fsync: bool = False):
+        """Local record of the task codes already completed in each execution
+
+        Each execution has an append-only log with one completed code per line,
+        loaded into an in-memory set on first use, so lookups take constant time
+        and a restarted execution can skip the items it already completed.
+
+        Args:
+            directory (str, optional): Directory of the logs. Defaults to "checkpoints".
+            fsync (bool, optional): Forces every completed code to disk before returning,
+            instead of leaving it to the operating system. Defaults to False.
+        """
+        self._directory = directory
+        self._fsync = fsync
+        self._completed = {}
+        self._files = {}
+        self._torn = set()
+        self._lock = threading.Lock()
+
+    def _path(self, execution_id: str) -> str:
+        return os.path.join(self._directory, f"{re.sub(r'[^\w.-]', '_', execution_id)}.log")
+
+    def _load(self, execution_id: str) -> set[str]:
+        completed = self._completed.get(execution_id)
+        if completed is not None:
+            return completed
+
+        completed = set()
+        line = b"\n"
+        try:
+            with open(self._path(execution_id), "rb") as file:
+                for line in file:
+                    try:
+                        completed.add(codec.loads(line))
+                    except ValueError:
+                        # Line cut short by an interrupted write
+                        continue
+            if not line.endswith(b"\n"):
+                self._torn.add(execution_id)
+        except FileNotFoundError:
+            pass
+        self._completed[execution_id] = completed
+        return completed
+
+    def is_done(self, execution_id: str, code: str) -> bool:
+        """Checks whether a task code was completed in an execution"""
+        with self._lock:
+            return code in self._load(execution_id)
+
+    def mark_done(self, execution_id: str, code: str):
+        """Records a task code as completed in an execution"""
+        with self._lock:
+            completed = self._load(execution_id)
+            if code in completed:
+                return
+            file = self._files.get(execution_id)
+            if file is None:
+                os.makedirs(self._directory, exist_ok=True)
+                file = self._files[execution_id] = open(self._path(execution_id), "ab")
+                if execution_id in self._torn:
+                    # Keeps the next code off the line of an interrupted write
+                    file.write(b"\n")
+                    self._torn.discard(execution_id)
+            file.write(codec.dumps(code) + b"\n")
+            file.flush()
+            if self._fsync:
+                os.fsync(file.fileno())
+            completed.add(code)
+
+    def completed(self, execution_id: str) -> set[str]:
+        """Returns the task codes completed in an execution"""
+        with self._lock:
+            return set(self._load(execution_id))
+
+    def clear(self, execution_id: str):
+        """Removes the log of an execution, e.g. once it finished"""
+        with self._lock:
+            self._completed.pop(execution_id, None)
+            self._torn.discard(execution_id)
+            file = self._files.pop(execution_id, None)
+            if file is not None:
+                file.close()
+            try:
+                os.remove(self._path(execution_id))
+            except FileNotFoundError:
+                pass
+
+    def close(self):
+        with self._lock:
+            for file in self._files.values():
+                file.close()
+            self._files.clear()
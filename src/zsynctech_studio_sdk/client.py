@@ -1,30 +1,654 @@
+from zsynctech_studio_sdk.dispatcher import TelemetryDispatcher
+from zsynctech_studio_sdk.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RequestMetrics,
+    RetryPolicy,
+    is_gateway_failure,
+)
+from zsynctech_studio_sdk.delta import DeltaTracker, RESYNC_STATUSES, UNSUPPORTED_STATUSES
+from zsynctech_studio_sdk.instrumentation import Instrumentation
+from zsynctech_studio_sdk.profiling import StepProfiler
+from zsynctech_studio_sdk.compression import get_compressor
+from zsynctech_studio_sdk import codec
+from typing import TYPE_CHECKING, Callable, Generator, Literal, Optional
+import contextlib
+import threading
+import weakref
+import atexit
 import httpx
+import time
 
-_client = None
-_secret_key = None
-_instance_id = None
-_server = None
-
-
-def set_credentials(secret_key: str, instance_id: str, server: str):
-    global _client, _secret_key, _server, _instance_id
-    _secret_key = secret_key
-    _instance_id = instance_id
-    _server = str(server).rstrip("/")
-    _client = httpx.Client(
-        base_url=f"{_server}/automation-gateway/",
-        headers={
-            "Authorization": f"Bearer {_secret_key}::{_instance_id}"
-        }
+if TYPE_CHECKING:
+    from zsynctech_studio_sdk.outbox import Outbox
+
+_default_client = None
+_dispatching_clients = weakref.WeakSet()
+
+
+def _encode_json(kwargs: dict) -> dict:
+    """Replaces the `json` argument of a request with the body encoded once by the codec"""
+    payload = kwargs.pop("json", None)
+    if payload is not None:
+        kwargs["content"] = codec.dumps(payload)
+        kwargs["headers"] = {**(kwargs.get("headers") or {}), "Content-Type": "application/json"}
+    return kwargs
+
+
+class StudioClient:
+    def __init__(
+            self,
+            secret_key: str,
+            instance_id: str,
+            server: str,
+            max_connections: int = 100,
+            max_keepalive_connections: int = 20,
+            keepalive_expiry: float = 5.0,
+            http2: bool = False,
+            timeout: float = 10.0,
+            retry: Optional[RetryPolicy] = RetryPolicy(),
+            circuit_breaker: Optional[CircuitBreaker] = None,
+            delta_updates: bool = False,
+            compression: Optional[str] = None,
+            compression_threshold: int = 1024,
+            compression_level: Optional[int] = None,
+        ):
+        """Connection to the automation-gateway of one robot instance
+
+        Args:
+            secret_key (str): Secret key of the instance.
+            instance_id (str): Instance id.
+            server (str): Server base url.
+            max_connections (int, optional): Maximum number of concurrent connections. Defaults to 100.
+            max_keepalive_connections (int, optional): Maximum number of idle connections kept open. Defaults to 20.
+            keepalive_expiry (float, optional): Time in seconds an idle connection is kept open. Defaults to 5.0.
+            http2 (bool, optional): Enables HTTP/2, requires the `http2` extra. Defaults to False.
+            timeout (float, optional): Default timeout in seconds of each request attempt. Defaults to 10.0.
+            retry (Optional[RetryPolicy], optional): Retry policy, None disables retries. Defaults to RetryPolicy().
+            circuit_breaker (Optional[CircuitBreaker], optional): Circuit breaker shared by the
+            requests of this client, None disables it. Defaults to None.
+            delta_updates (bool, optional): After an entity is created, sends only its changed
+            fields with PATCH instead of the whole entity. Defaults to False.
+            compression (Optional[str], optional): Request body encoding, "gzip" or "zstd"
+            (requires Python 3.14 or the `zstd` extra), None sends bodies uncompressed. Defaults to None.
+            compression_threshold (int, optional): Minimum body size in bytes to compress. Defaults to 1024.
+            compression_level (Optional[int], optional): Compression level, None uses the
+            encoding default. Defaults to None.
+        """
+        self._secret_key = secret_key
+        self._instance_id = instance_id
+        self._server = str(server).rstrip("/")
+        self._client_options = dict(
+            base_url=f"{self._server}/automation-gateway/",
+            headers={
+                "Authorization": f"Bearer {self._secret_key}::{self._instance_id}"
+            },
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            http2=http2,
+            timeout=timeout,
+        )
+        self._client = httpx.Client(**self._client_options)
+        self._retry = retry
+        self._circuit_breaker = circuit_breaker
+        self._metrics = RequestMetrics()
+        self._delta = DeltaTracker() if delta_updates else None
+        self._compression = compression
+        self._compression_threshold = compression_threshold
+        self._compressor = get_compressor(compression, compression_level) if compression else None
+        self._async_client = None
+        self._dispatcher = None
+        self._dispatcher_flush_timeout = None
+        self._outbox = None
+        self._outbox_flush_timeout = None
+        self._instrumentation = None
+        self._step_profiler = None
+        self._lock = threading.Lock()
+
+    @property
+    def instance_id(self) -> str:
+        return self._instance_id
+
+    @property
+    def server(self) -> str:
+        return self._server
+
+    @property
+    def metrics(self) -> RequestMetrics:
+        return self._metrics
+
+    @property
+    def pending_count(self) -> int:
+        """Number of status updates waiting in the dispatcher"""
+        dispatcher = self._dispatcher
+        return dispatcher.pending_count if dispatcher is not None else 0
+
+    @property
+    def instrumentation(self) -> Optional[Instrumentation]:
+        return self._instrumentation
+
+    @property
+    def step_profiler(self) -> Optional[StepProfiler]:
+        return self._step_profiler
+
+    def _compress_body(self, kwargs: dict) -> dict:
+        content = kwargs.get("content")
+        if self._compressor is None or not isinstance(content, bytes) or len(content) < self._compression_threshold:
+            return kwargs
+        kwargs["content"] = self._compressor(content)
+        kwargs["headers"] = {**(kwargs.get("headers") or {}), "Content-Encoding": self._compression}
+        return kwargs
+
+    def _record_attempt(self, started: float):
+        latency = time.perf_counter() - started
+        self._metrics.record_attempt(latency)
+        instrumentation = self._instrumentation
+        if instrumentation is not None:
+            instrumentation.observe_gateway(latency)
+
+    def _retry_flow(self, method: str, endpoint: str) -> Generator[float, Optional[httpx.HTTPError], None]:
+        """Retry and circuit breaker decisions of a request, shared by `request` and `arequest`
+
+        Started with `next`, which rejects the request if the circuit is open, it is then
+        sent the outcome of each attempt: the `httpx.HTTPError` it raised, or None once it
+        succeeded, which ends the flow. After an error it yields the delay before the next
+        attempt, or raises the error when the request must not be retried. Closing it
+        before the end, e.g. on a cancellation, ends a circuit breaker trial without a verdict.
+        """
+        if self._circuit_breaker is not None and not self._circuit_breaker.allow():
+            self._metrics.record_request(failed=True, rejected=True)
+            raise CircuitOpenError(f"Gateway circuit is open, request to '{endpoint}' rejected.")
+
+        try:
+            attempt = 1
+            error = yield 0.0
+            while error is not None:
+                if self._retry is None or not self._retry.should_retry(method, error, attempt):
+                    self._metrics.record_request(failed=True)
+                    if self._circuit_breaker is not None:
+                        if is_gateway_failure(error):
+                            self._circuit_breaker.record_failure()
+                        else:
+                            self._circuit_breaker.record_neutral()
+                    raise error
+                delay = self._retry.delay(attempt)
+                self._metrics.record_retry(delay)
+                attempt += 1
+                error = yield delay
+        except GeneratorExit:
+            if self._circuit_breaker is not None:
+                self._circuit_breaker.record_neutral()
+            raise
+
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.record_success()
+        self._metrics.record_request()
+
+    def request(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
+        """Sends a request to the gateway, retrying it according to the retry policy
+
+        A `json` body is encoded once with the configured codec and sent as bytes,
+        compressed when it reaches the compression threshold.
+
+        Raises:
+            CircuitOpenError: The circuit breaker is open.
+            httpx.HTTPError: The request failed after every attempt.
+        """
+        flow = self._retry_flow(method, endpoint)
+        next(flow)
+        with contextlib.closing(flow):
+            kwargs = self._compress_body(_encode_json(kwargs))
+            while True:
+                started = time.perf_counter()
+                try:
+                    response = self._client.request(method, endpoint, **kwargs)
+                    response.raise_for_status()
+                except httpx.HTTPError as e:
+                    self._record_attempt(started)
+                    time.sleep(flow.send(e))
+                    continue
+                self._record_attempt(started)
+                next(flow, None)
+                return response
+
+    def get(self, endpoint: str, params: dict = None) -> httpx.Response:
+        return self.request("GET", endpoint, params=params)
+
+    def post(self, endpoint: str, json: dict = None) -> httpx.Response:
+        return self.request("POST", endpoint, json=json)
+
+    def put(self, endpoint: str, json: dict = None) -> httpx.Response:
+        return self.request("PUT", endpoint, json=json)
+
+    def delete(self, endpoint: str) -> httpx.Response:
+        return self.request("DELETE", endpoint)
+
+    async def arequest(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
+        """Async version of `request`"""
+        import asyncio
+
+        if self._async_client is None or self._async_client.is_closed:
+            self._async_client = httpx.AsyncClient(**self._client_options)
+        flow = self._retry_flow(method, endpoint)
+        next(flow)
+        with contextlib.closing(flow):
+            kwargs = self._compress_body(_encode_json(kwargs))
+            while True:
+                started = time.perf_counter()
+                try:
+                    response = await self._async_client.request(method, endpoint, **kwargs)
+                    response.raise_for_status()
+                except httpx.HTTPError as e:
+                    self._record_attempt(started)
+                    await asyncio.sleep(flow.send(e))
+                    continue
+                self._record_attempt(started)
+                next(flow, None)
+                return response
+
+    async def apost(self, endpoint: str, json: dict = None) -> httpx.Response:
+        return await self.arequest("POST", endpoint, json=json)
+
+    def _send_update(self, endpoint: str, payload: dict) -> httpx.Response:
+        """Sends an entity, as a PATCH of its changed fields if it was already acknowledged"""
+        delta = self._delta
+        if delta is None or payload is None:
+            return self.post(endpoint, json=payload)
+
+        changes = delta.changes(endpoint, payload)
+        if changes is None:
+            response = self.post(endpoint, json=payload)
+        else:
+            try:
+                response = self.request("PATCH", f"{endpoint}/{payload['id']}", json=changes)
+            except httpx.HTTPStatusError as e:
+                if not self._resync(endpoint, payload, e):
+                    raise
+                response = self.post(endpoint, json=payload)
+        delta.acknowledge(endpoint, payload)
+        return response
+
+    def _resync(self, endpoint: str, payload: dict, error: httpx.HTTPStatusError) -> bool:
+        """Tells whether a rejected partial update is sent again as a full entity, counted in `metrics`"""
+        status_code = error.response.status_code
+        if status_code in UNSUPPORTED_STATUSES:
+            # The gateway does not accept partial updates, full entities are sent from now on
+            self._delta = None
+        elif status_code not in RESYNC_STATUSES:
+            return False
+        self._metrics.record_resync()
+        return True
+
+    def enable_dispatcher(
+            self,
+            max_batch_size: int = 100,
+            flush_interval: float = 1.0,
+            max_queue_size: int = 10000,
+            debounce: float = 0.0,
+            flush_timeout: float = 10.0,
+        ) -> TelemetryDispatcher:
+        """Sends Execution, Task and Step status updates from a background thread
+
+        Args:
+            max_batch_size (int, optional): Number of pending updates that triggers a submission. Defaults to 100.
+            flush_interval (float, optional): Maximum time in seconds an update waits in the queue. Defaults to 1.0.
+            max_queue_size (int, optional): Maximum number of pending updates before callers block. Defaults to 10000.
+            debounce (float, optional): Minimum time in seconds an update waits so a newer state
+            of the same entity can replace it. Defaults to 0.0.
+            flush_timeout (float, optional): Maximum time in seconds `flush` and `close` wait for
+            the gateway when no timeout is given, so an unreachable gateway never holds the robot
+            or the process exit. Defaults to 10.0.
+
+        Returns:
+            TelemetryDispatcher: The dispatcher in use
+        """
+        with self._lock:
+            if self._dispatcher is not None:
+                self._dispatcher.close(self._dispatcher_flush_timeout)
+            self._dispatcher = TelemetryDispatcher(
+                send=self._deliver,
+                max_batch_size=max_batch_size,
+                flush_interval=flush_interval,
+                max_queue_size=max_queue_size,
+                debounce=debounce,
+            )
+            self._dispatcher_flush_timeout = flush_timeout
+            _dispatching_clients.add(self)
+            return self._dispatcher
+
+    def disable_dispatcher(self, timeout: Optional[float] = None):
+        """Sends the pending updates and goes back to synchronous requests
+
+        Args:
+            timeout (Optional[float], optional): Maximum time in seconds to wait for the
+            pending updates to be sent. Defaults to the dispatcher `flush_timeout`.
+        """
+        with self._lock:
+            if self._dispatcher is not None:
+                self._dispatcher.close(self._dispatcher_flush_timeout if timeout is None else timeout)
+                self._dispatcher = None
+            self._dispatcher_flush_timeout = None
+
+    def enable_outbox(
+            self,
+            path: str,
+            max_entries: int = 100000,
+            commit_interval: float = 0.05,
+            flush_timeout: float = 10.0,
+        ) -> "Outbox":
+        """Stores status updates in a durable outbox before sending them
+
+        Updates are replayed with retries by a background drainer, so gateway
+        failures never reach the robot and pending updates survive a crash.
+
+        Args:
+            path (str): SQLite database file of the outbox.
+            max_entries (int, optional): Maximum number of stored updates. Defaults to 100000.
+            commit_interval (float, optional): Time in seconds between group commits to disk. Defaults to 0.05.
+            flush_timeout (float, optional): Maximum time in seconds `flush` waits for the gateway
+            to receive the stored updates. Defaults to 10.0.
+
+        Returns:
+            Outbox: The outbox in use
+        """
+        from zsynctech_studio_sdk.outbox import Outbox
+
+        with self._lock:
+            if self._outbox is not None:
+                self._outbox.close(self._outbox_flush_timeout)
+            self._outbox = Outbox(
+                path=path,
+                send=self._send_update,
+                max_entries=max_entries,
+                commit_interval=commit_interval,
+            )
+            self._outbox_flush_timeout = flush_timeout
+            _dispatching_clients.add(self)
+            return self._outbox
+
+    def disable_outbox(self, timeout: Optional[float] = None):
+        """Writes the pending updates to disk and goes back to sending them directly
+
+        Args:
+            timeout (Optional[float], optional): Maximum time in seconds to wait for the
+            stored updates to be sent. Defaults to the outbox `flush_timeout`.
+        """
+        with self._lock:
+            if self._outbox is not None:
+                self._outbox.close(self._outbox_flush_timeout if timeout is None else timeout)
+                self._outbox = None
+
+    def enable_instrumentation(
+            self,
+            span_exporter: Optional[Callable[[list[dict]], None]] = None,
+            max_spans: int = 10000,
+        ) -> Instrumentation:
+        """Records durations and outcomes of Executions, Tasks and Steps, gateway latency and queue depths
+
+        Args:
+            span_exporter (Optional[Callable[[list[dict]], None]], optional): Function that receives
+            the finished spans when `flush` waits for the pending updates. Defaults to None.
+            max_spans (int, optional): Maximum number of finished spans kept until exported,
+            0 disables spans. Defaults to 10000.
+
+        Returns:
+            Instrumentation: The instrumentation in use
+        """
+        instrumentation = Instrumentation(span_exporter=span_exporter, max_spans=max_spans)
+        instrumentation.add_metric(
+            "zsynctech_dispatcher_pending",
+            lambda: self._dispatcher.pending_count if self._dispatcher is not None else 0
+        )
+        instrumentation.add_metric(
+            "zsynctech_outbox_pending",
+            lambda: self._outbox.pending_count if self._outbox is not None else 0
+        )
+        instrumentation.add_metric("zsynctech_gateway_requests_total", lambda: self._metrics.requests, "counter")
+        instrumentation.add_metric("zsynctech_gateway_retries_total", lambda: self._metrics.retries, "counter")
+        instrumentation.add_metric("zsynctech_gateway_failures_total", lambda: self._metrics.failures, "counter")
+        self._instrumentation = instrumentation
+        _dispatching_clients.add(self)
+        return instrumentation
+
+    def disable_instrumentation(self):
+        """Exports the finished spans and stops recording"""
+        instrumentation, self._instrumentation = self._instrumentation, None
+        if instrumentation is not None:
+            instrumentation.export_spans()
+
+    def enable_step_profiling(
+            self,
+            threshold: float,
+            directory: str = "profiles",
+            mode: Literal["sampling", "cprofile"] = "sampling",
+            interval: float = 0.01,
+            annotate_observation: bool = False,
+        ) -> StepProfiler:
+        """Stores a profile of every Step that runs longer than `threshold`
+
+        Args:
+            threshold (float): Step duration in seconds after which a profile is stored.
+            directory (str, optional): Directory of the stored profiles. Defaults to "profiles".
+            mode (Literal["sampling", "cprofile"], optional): "sampling" samples the stack from a
+            watchdog thread once the threshold is crossed, "cprofile" runs every step under
+            cProfile. Defaults to "sampling".
+            interval (float, optional): Time in seconds between stack samples. Defaults to 0.01.
+            annotate_observation (bool, optional): Adds the profile path to the observation
+            of the step. Defaults to False.
+
+        Returns:
+            StepProfiler: The profiler in use
+        """
+        self.disable_step_profiling()
+        self._step_profiler = StepProfiler(
+            threshold=threshold,
+            directory=directory,
+            mode=mode,
+            interval=interval,
+            annotate_observation=annotate_observation,
+        )
+        return self._step_profiler
+
+    def disable_step_profiling(self):
+        step_profiler, self._step_profiler = self._step_profiler, None
+        if step_profiler is not None:
+            step_profiler.close()
+
+    def _deliver(self, endpoint: str, payload: dict):
+        outbox = self._outbox
+        if outbox is None:
+            self._send_update(endpoint, payload)
+        else:
+            outbox.append(endpoint, payload)
+
+    def submit(self, endpoint: str, json: dict = None, must_deliver: bool = False):
+        """Sends a status update, queuing it when the dispatcher is enabled
+
+        Args:
+            endpoint (str): Gateway endpoint of the entity.
+            json (dict, optional): Entity data. Defaults to None.
+            must_deliver (bool, optional): Keeps this state even if a newer one of the
+            same entity is queued before it is sent. Defaults to False.
+        """
+        dispatcher = self._dispatcher
+        if dispatcher is None:
+            self._deliver(endpoint, json)
+        else:
+            dispatcher.put(endpoint, json, must_deliver=must_deliver)
+
+    def flush(self, wait: bool = True, timeout: Optional[float] = None) -> bool:
+        """Requests the submission of the queued status updates
+
+        Args:
+            wait (bool, optional): Blocks until every queued update is sent. Defaults to True.
+            timeout (Optional[float], optional): Maximum time in seconds to wait. Defaults to
+            the `flush_timeout` of the dispatcher and of the outbox.
+
+        Returns:
+            bool: True if there are no pending updates left
+        """
+        flushed = True
+        dispatcher = self._dispatcher
+        if dispatcher is not None:
+            flushed = dispatcher.flush(
+                wait=wait,
+                timeout=self._dispatcher_flush_timeout if timeout is None else timeout
+            )
+
+        outbox = self._outbox
+        if outbox is not None and wait:
+            flushed = outbox.flush(self._outbox_flush_timeout if timeout is None else timeout) and flushed
+
+        instrumentation = self._instrumentation
+        if instrumentation is not None and wait:
+            instrumentation.export_spans()
+        return flushed
+
+    def close(self):
+        """Sends the pending updates and closes the connections"""
+        self.disable_dispatcher()
+        self.disable_outbox()
+        self.disable_instrumentation()
+        self.disable_step_profiling()
+        self._client.close()
+
+    async def aclose(self):
+        """Closes the async connections"""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+
+def set_credentials(secret_key: str, instance_id: str, server: str, **kwargs) -> StudioClient:
+    """Configures the default client used when no client is passed explicitly
+
+    Args:
+        secret_key (str): Secret key of the instance.
+        instance_id (str): Instance id.
+        server (str): Server base url.
+        **kwargs: Connection pool options accepted by `StudioClient`.
+
+    Returns:
+        StudioClient: The default client
+    """
+    global _default_client
+    _default_client = StudioClient(secret_key, instance_id, server, **kwargs)
+    return _default_client
+
+
+def get_client(client: Optional[StudioClient] = None) -> StudioClient:
+    """Returns the given client or the default one configured by `set_credentials`"""
+    if client is not None:
+        return client
+    if _default_client is None:
+        raise RuntimeError("Credentials not set. Call set_credentials() first.")
+    return _default_client
+
+
+def enable_dispatcher(
+        max_batch_size: int = 100,
+        flush_interval: float = 1.0,
+        max_queue_size: int = 10000,
+        debounce: float = 0.0,
+        flush_timeout: float = 10.0,
+    ) -> TelemetryDispatcher:
+    """Enables the background dispatcher of the default client, see `StudioClient.enable_dispatcher`"""
+    return get_client().enable_dispatcher(
+        max_batch_size=max_batch_size,
+        flush_interval=flush_interval,
+        max_queue_size=max_queue_size,
+        debounce=debounce,
+        flush_timeout=flush_timeout,
     )
 
 
+def disable_dispatcher(timeout: Optional[float] = None):
+    """Sends the pending updates of the default client and goes back to synchronous requests"""
+    if _default_client is not None:
+        _default_client.disable_dispatcher(timeout)
+
+
+def submit(endpoint: str, json: dict = None, must_deliver: bool = False):
+    return get_client().submit(endpoint, json=json, must_deliver=must_deliver)
+
+
+def flush(wait: bool = True, timeout: Optional[float] = None) -> bool:
+    """Requests the submission of the status updates queued on the default client"""
+    if _default_client is None:
+        return True
+    return _default_client.flush(wait=wait, timeout=timeout)
+
+
+def enable_outbox(
+        path: str,
+        max_entries: int = 100000,
+        commit_interval: float = 0.05,
+        flush_timeout: float = 10.0,
+    ) -> "Outbox":
+    """Enables the durable outbox of the default client, see `StudioClient.enable_outbox`"""
+    return get_client().enable_outbox(
+        path=path,
+        max_entries=max_entries,
+        commit_interval=commit_interval,
+        flush_timeout=flush_timeout,
+    )
+
+
+def disable_outbox(timeout: Optional[float] = None):
+    """Writes the pending updates of the default client to disk and goes back to sending them directly"""
+    if _default_client is not None:
+        _default_client.disable_outbox(timeout)
+
+
+def enable_instrumentation(
+        span_exporter: Optional[Callable[[list[dict]], None]] = None,
+        max_spans: int = 10000,
+    ) -> Instrumentation:
+    """Enables the instrumentation of the default client, see `StudioClient.enable_instrumentation`"""
+    return get_client().enable_instrumentation(span_exporter=span_exporter, max_spans=max_spans)
+
+
+def enable_step_profiling(
+        threshold: float,
+        directory: str = "profiles",
+        mode: Literal["sampling", "cprofile"] = "sampling",
+        interval: float = 0.01,
+        annotate_observation: bool = False,
+    ) -> StepProfiler:
+    """Enables the profiling of slow Steps of the default client, see `StudioClient.enable_step_profiling`"""
+    return get_client().enable_step_profiling(
+        threshold=threshold,
+        directory=directory,
+        mode=mode,
+        interval=interval,
+        annotate_observation=annotate_observation,
+    )
+
+
+def disable_step_profiling():
+    if _default_client is not None:
+        _default_client.disable_step_profiling()
+
+
+def disable_instrumentation():
+    """Exports the finished spans of the default client and stops recording"""
+    if _default_client is not None:
+        _default_client.disable_instrumentation()
+
+
+@atexit.register
+def _close_dispatchers():
+    for studio_client in list(_dispatching_clients):
+        studio_client.disable_dispatcher()
+        studio_client.disable_outbox()
+        studio_client.disable_instrumentation()
+
+
 def request(method: str, endpoint: str, **kwargs) -> httpx.Response:
-    if _client is None:
-        raise RuntimeError("Credentials not set. Call set_credentials() first.")
-    response = _client.request(method, endpoint, **kwargs)
-    response.raise_for_status()
-    return response
+    return get_client().request(method, endpoint, **kwargs)
 
 def get(endpoint: str, params: dict = None) -> httpx.Response:
     return request("GET", endpoint, params=params)
@@ -36,4 +660,4 @@ def put(endpoint: str, json: dict = None) -> httpx.Response:
     return request("PUT", endpoint, json=json)
 
 def delete(endpoint: str) -> httpx.Response:
-    return request("DELETE", endpoint)
\ No newline at end of file
+    return request("DELETE", endpoint)
@@ -0,0 +1,50 @@
+from typing import Any, Callable, Optional
+import pydantic_core
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode()
+
+
+CODECS: dict[str, tuple[Callable[[Any], bytes], Callable[[bytes], Any]]] = {
+    "json": (_stdlib_dumps, json.loads),
+    "pydantic": (pydantic_core.to_json, pydantic_core.from_json),
+}
+if orjson is not None:
+    CODECS["orjson"] = (orjson.dumps, orjson.loads)
+
+_name = None
+dumps = None
+loads = None
+
+
+def set_codec(name: Optional[str] = None):
+    """Selects the JSON codec used for gateway payloads and the outbox
+
+    Args:
+        name (Optional[str], optional): One of "orjson" (requires the `fast` extra),
+        "pydantic" or "json". None selects the fastest available. Defaults to None.
+
+    Raises:
+        ValueError: The codec is not available.
+    """
+    global _name, dumps, loads
+    if name is None:
+        name = "orjson" if "orjson" in CODECS else "pydantic"
+    if name not in CODECS:
+        raise ValueError(f"JSON codec '{name}' is not available, choose one of: {', '.join(CODECS)}")
+    _name = name
+    dumps, loads = CODECS[name]
+
+
+def get_codec() -> str:
+    return _name
+
+
+set_codec()
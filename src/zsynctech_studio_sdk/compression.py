@@ -0,0 +1,47 @@
+from typing import Callable, Optional
+import threading
+import gzip
+
+ENCODINGS = ("gzip", "zstd")
+
+
+def _zstd_compressor(level: Optional[int]) -> Callable[[bytes], bytes]:
+    try:
+        from compression import zstd
+    except ImportError:
+        zstd = None
+    if zstd is not None:
+        return lambda data: zstd.compress(data, level=level)
+
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(
+            "zstd compression requires zstandard. Install it with: pip install \"zsynctech-studio-sdk[zstd]\""
+        ) from None
+    local = threading.local()
+
+    def compress(data: bytes) -> bytes:
+        compressor = getattr(local, "compressor", None)
+        if compressor is None:
+            compressor = local.compressor = zstandard.ZstdCompressor(level=3 if level is None else level)
+        return compressor.compress(data)
+    return compress
+
+
+def get_compressor(encoding: str, level: Optional[int] = None) -> Callable[[bytes], bytes]:
+    """Returns the function that compresses request bodies with the encoding
+
+    Args:
+        encoding (str): "gzip" or "zstd" (requires Python 3.14 or the `zstd` extra).
+        level (Optional[int], optional): Compression level, None uses the encoding default. Defaults to None.
+
+    Raises:
+        ValueError: The encoding is not supported.
+        ImportError: The zstd library is not installed.
+    """
+    if encoding == "gzip":
+        return lambda data: gzip.compress(data, compresslevel=6 if level is None else level, mtime=0)
+    if encoding == "zstd":
+        return _zstd_compressor(level)
+    raise ValueError(f"Unsupported compression '{encoding}', choose one of: {', '.join(ENCODINGS)}")
@@ -0,0 +1,50 @@
+from collections import OrderedDict
+from typing import Optional
+import threading
+
+RESYNC_STATUSES = frozenset({404, 409, 410, 412})
+UNSUPPORTED_STATUSES = frozenset({405, 501})
+
+
+class DeltaTracker:
+    def __init__(self, max_entities: int = 10000):
+        """Last state of each entity acknowledged by the gateway
+
+        Fields that differ from the acknowledged state are the dirty fields of an
+        update, the only ones sent after the entity was created.
+
+        Args:
+            max_entities (int, optional): Maximum number of tracked entities, the least
+            recently updated are forgotten and sent in full again. Defaults to 10000.
+        """
+        self._max_entities = max_entities
+        self._acknowledged = OrderedDict()
+        self._lock = threading.Lock()
+
+    def changes(self, endpoint: str, payload: dict) -> Optional[dict]:
+        """Returns the fields of the payload changed since the last acknowledged state
+
+        Args:
+            endpoint (str): Gateway endpoint of the entity.
+            payload (dict): Entity data.
+
+        Returns:
+            Optional[dict]: Entity `id` and changed fields, None if the entity must be sent in full
+        """
+        with self._lock:
+            acknowledged = self._acknowledged.get((endpoint, payload["id"]))
+        if acknowledged is None:
+            return None
+        changes = {"id": payload["id"]}
+        for name, value in payload.items():
+            if name not in acknowledged or acknowledged[name] != value:
+                changes[name] = value
+        return changes
+
+    def acknowledge(self, endpoint: str, payload: dict):
+        with self._lock:
+            key = (endpoint, payload["id"])
+            self._acknowledged[key] = payload
+            self._acknowledged.move_to_end(key)
+            if len(self._acknowledged) > self._max_entities:
+                self._acknowledged.popitem(last=False)
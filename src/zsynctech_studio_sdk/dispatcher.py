@@ -0,0 +1,177 @@
+from typing import Callable, Optional
+from collections import OrderedDict
+import threading
+import time
+
+
+class TelemetryDispatcher:
+    def __init__(
+            self,
+            send: Callable[[str, dict], object],
+            max_batch_size: int = 100,
+            flush_interval: float = 1.0,
+            max_queue_size: int = 10000,
+            debounce: float = 0.0,
+        ):
+        """Background dispatcher that takes status updates off the robot's critical path
+
+        Args:
+            send (Callable[[str, dict], object]): Function used to deliver a single payload to an endpoint.
+            max_batch_size (int, optional): Number of pending updates that triggers a submission. Defaults to 100.
+            flush_interval (float, optional): Maximum time in seconds an update waits in the queue. Defaults to 1.0.
+            max_queue_size (int, optional): Maximum number of pending updates before `put` blocks. Defaults to 10000.
+            debounce (float, optional): Minimum time in seconds an update stays pending so newer
+            states of the same entity can replace it. Defaults to 0.0.
+        """
+        self._send = send
+        self._max_batch_size = max_batch_size
+        self._flush_interval = flush_interval
+        self._max_queue_size = max_queue_size
+        self._debounce = debounce
+
+        # Pending updates by slot, in queue order, and the slot of each entity whose
+        # pending update can still be replaced by a newer one
+        self._pending = OrderedDict()
+        self._slots = {}
+        self._coalesced_count = 0
+        self._in_flight = 0
+        self._flush_requested = False
+        self._closed = False
+        self._condition = threading.Condition()
+
+        self._worker = threading.Thread(
+            target=self._run,
+            name="zsynctech-telemetry",
+            daemon=True
+        )
+        self._worker.start()
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending) + self._in_flight
+
+    @property
+    def coalesced_count(self) -> int:
+        return self._coalesced_count
+
+    def put(self, endpoint: str, payload: dict, must_deliver: bool = False):
+        """Queues a payload to be sent to the endpoint
+
+        A pending update of the same entity `id` is replaced by the newer one in
+        its place in the queue, unless it was queued with `must_deliver`.
+
+        Args:
+            endpoint (str): Gateway endpoint of the entity.
+            payload (dict): Entity data.
+            must_deliver (bool, optional): Never drop this state in favor of a newer one. Defaults to False.
+        """
+        key = (endpoint, payload.get("id"))
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Dispatcher is closed.")
+
+            slot = self._slots.get(key)
+            if slot is not None:
+                # Keeps the position of the replaced update, so entities are still
+                # sent in the order they were created
+                _, _, queued_at, _ = self._pending[slot]
+                self._pending[slot] = (endpoint, payload, queued_at, key)
+                if must_deliver:
+                    del self._slots[key]
+                self._coalesced_count += 1
+                return
+
+            while len(self._pending) >= self._max_queue_size:
+                self._condition.wait()
+
+            slot = object()
+            self._pending[slot] = (endpoint, payload, time.monotonic(), key)
+            if not must_deliver:
+                self._slots[key] = slot
+            if len(self._pending) == 1 or len(self._pending) >= self._max_batch_size:
+                self._condition.notify_all()
+
+    def flush(self, wait: bool = True, timeout: Optional[float] = None) -> bool:
+        """Requests the immediate submission of every pending update
+
+        Args:
+            wait (bool, optional): Blocks until the queue is drained. Defaults to True.
+            timeout (Optional[float], optional): Maximum time in seconds to wait. Defaults to None.
+
+        Returns:
+            bool: True if there are no pending updates left
+        """
+        with self._condition:
+            self._flush_requested = True
+            self._condition.notify_all()
+            if not wait:
+                return self.pending_count == 0
+            return self._condition.wait_for(
+                lambda: self.pending_count == 0,
+                timeout=timeout
+            )
+
+    def close(self, timeout: Optional[float] = None):
+        """Sends the pending updates and stops the background worker
+
+        Args:
+            timeout (Optional[float], optional): Maximum time in seconds to wait. Defaults to None.
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        self._worker.join(timeout)
+
+    def _send_at(self) -> Optional[float]:
+        if not self._pending:
+            return None
+        _, _, queued_at, _ = next(iter(self._pending.values()))
+        if len(self._pending) >= self._max_batch_size:
+            return queued_at + self._debounce
+        return queued_at + max(self._flush_interval, self._debounce)
+
+    def _next_batch(self) -> list:
+        with self._condition:
+            while not self._closed and not self._flush_requested:
+                send_at = self._send_at()
+                if send_at is None:
+                    self._condition.wait()
+                    continue
+                remaining = send_at - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+
+            drain = self._closed or self._flush_requested
+            ready_at = time.monotonic() - self._debounce
+            batch = []
+            while self._pending and len(batch) < self._max_batch_size:
+                slot, (endpoint, payload, queued_at, key) = next(iter(self._pending.items()))
+                if not drain and queued_at > ready_at:
+                    break
+                del self._pending[slot]
+                if self._slots.get(key) is slot:
+                    del self._slots[key]
+                batch.append((endpoint, payload))
+            if not self._pending:
+                self._flush_requested = False
+            self._in_flight = len(batch)
+            self._condition.notify_all()
+            return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            for endpoint, payload in batch:
+                try:
+                    self._send(endpoint, payload)
+                except Exception as e:
+                    print(f"[TelemetryDispatcher] Failed to send update to '{endpoint}': {e}")
+
+            with self._condition:
+                self._in_flight = 0
+                self._condition.notify_all()
+                if self._closed and not self._pending:
+                    return
@@ -1,8 +1,17 @@
 from zsynctech_studio_sdk.models import ExecutionModel
 from zsynctech_studio_sdk.enums import ExecutionStatus
 from zsynctech_studio_sdk.utils import get_utc_now
-from zsynctech_studio_sdk import client
-from typing import Optional, Any
+from zsynctech_studio_sdk.client import StudioClient, get_client
+from zsynctech_studio_sdk.keepalive import KeepAlive
+from zsynctech_studio_sdk.progress import ProgressTracker
+from typing import TYPE_CHECKING, Optional, Any
+import contextlib
+import threading
+import time
+
+if TYPE_CHECKING:
+    from zsynctech_studio_sdk.models import Config
+    from zsynctech_studio_sdk.sinks import OutputSink
 
 EXECUTION_STATUS_COMPLETED = [
     ExecutionStatus.ERROR,
@@ -13,32 +22,38 @@ EXECUTION_STATUS_COMPLETED = [
 
 
 class Execution:
-    def __init__(self, execution_id: str):
+    def __init__(self, execution_id: str, client: Optional[StudioClient] = None):
         self._current_execution = ExecutionModel(
             id=execution_id
         )
         self._resource_path = "executions"
+        self._client = client
+        self._started = time.monotonic_ns()
+        self._last_update = time.monotonic()
+        self._keep_alive = None
+        self._sinks = []
+        self._lock = threading.Lock()
+        # Held while a keep-alive signal is sent, so a completed status is never
+        # overtaken by an older state sent by the keep-alive
+        self._signal_lock = threading.Lock()
 
     @property
     def execution_id(self):
         return self._current_execution.id
     
-    def _update(
+    def _apply(
             self,
             status: Optional[ExecutionStatus] = None,
             observation: Optional[str] = None,
             total_task_count: Optional[int] = None,
             current_task_count: Optional[int] = None,
         ) -> dict:
-
-        if self._current_execution.status in EXECUTION_STATUS_COMPLETED:
-            return self._current_execution.model_dump()
-
         if status in EXECUTION_STATUS_COMPLETED:
-            self._current_execution.endDate = get_utc_now()
+            self._current_execution.set_trusted(endDate=get_utc_now())
 
         if status is not None:
-            self._current_execution.status = status
+            self._instrument(status)
+            self._current_execution.set_trusted(status=status)
         
         if observation is not None:
             self._current_execution.observation = observation
@@ -49,12 +64,140 @@ class Execution:
         if current_task_count is not None:
             self._current_execution.currentTaskCount = current_task_count
 
-        client.post(
-            endpoint=self._resource_path,
-            json=self._current_execution.model_dump()
-        )
+        return self._current_execution.dump()
+
+    def _instrument(self, status: ExecutionStatus):
+        instrumentation = get_client(self._client).instrumentation
+        if instrumentation is None:
+            return
+        if status in EXECUTION_STATUS_COMPLETED and self._current_execution.status not in EXECUTION_STATUS_COMPLETED:
+            instrumentation.record("execution", self._current_execution.id, status, self._started)
 
-        return self._current_execution.model_dump()
+    def _update(
+            self,
+            status: Optional[ExecutionStatus] = None,
+            observation: Optional[str] = None,
+            total_task_count: Optional[int] = None,
+            current_task_count: Optional[int] = None,
+        ) -> dict:
+
+        sink_error = None
+        if status == ExecutionStatus.FINISHED:
+            # Raised before the status is sent, an execution whose output was lost is not finished
+            self._close_sinks()
+        elif status == ExecutionStatus.ERROR:
+            sink_error = self._close_sinks(raise_error=False)
+        elif status in EXECUTION_STATUS_COMPLETED:
+            # An interrupted execution is resumed later, so its outputs stay incomplete
+            sink_error = self._close_sinks(suspend=True, raise_error=False)
+
+        with self._signal_lock if status in EXECUTION_STATUS_COMPLETED else contextlib.nullcontext():
+            with self._lock:
+                if self._current_execution.status in EXECUTION_STATUS_COMPLETED:
+                    return dict(self._current_execution.dump())
+
+                get_client(self._client).submit(
+                    endpoint=self._resource_path,
+                    json=self._apply(status, observation, total_task_count, current_task_count),
+                    must_deliver=status in EXECUTION_STATUS_COMPLETED
+                )
+                self._last_update = time.monotonic()
+
+        if status in EXECUTION_STATUS_COMPLETED:
+            if self._keep_alive is not None:
+                self._keep_alive.stop()
+            get_client(self._client).flush()
+
+        if sink_error is not None:
+            raise sink_error
+        return dict(self._current_execution.dump())
+
+    def _close_sinks(self, suspend: bool = False, raise_error: bool = True) -> Optional[Exception]:
+        """Closes or suspends every output sink, keeping the ones that failed so they can be closed again
+
+        Returns:
+            Optional[Exception]: The first error, when `raise_error` is False
+        """
+        sinks, self._sinks = self._sinks, []
+        error = None
+        for sink in sinks:
+            try:
+                if suspend:
+                    sink.suspend()
+                else:
+                    sink.close()
+            except Exception as e:
+                print(f"[Execution] Failed to close output sink of execution {self.execution_id}: {e}")
+                self._sinks.append(sink)
+                error = error or e
+        if error is not None and raise_error:
+            raise error
+        return error
+
+    def add_sink(self, sink: "OutputSink") -> "OutputSink":
+        """Closes an output sink, writing its buffered records, before the execution is finished
+        or fails; when the execution is interrupted or out of operating hours the sink is only
+        suspended, so a resumed run can continue the output. A sink that fails to close is kept
+        and closed again with the next status, and its error is raised by the status method;
+        `finished` raises it before the status is sent
+
+        Args:
+            sink (OutputSink): Output sink of the execution.
+
+        Returns:
+            OutputSink: The same sink
+        """
+        self._sinks.append(sink)
+        return sink
+
+    def _keep_alive_signal(self, interval: float) -> bool:
+        """Sends a liveness signal if the execution had no update in the last `interval` seconds
+
+        Returns:
+            bool: False once the execution is completed
+        """
+        client = get_client(self._client)
+        with self._signal_lock:
+            with self._lock:
+                if self._current_execution.status in EXECUTION_STATUS_COMPLETED:
+                    return False
+                if time.monotonic() - self._last_update < interval:
+                    return True
+                payload = None if client.pending_count else self._current_execution.dump()
+                self._last_update = time.monotonic()
+
+            # Sent outside the lock, so updates of the robot never wait for the gateway
+            if payload is None:
+                client.flush(wait=False)
+            else:
+                client.submit(endpoint=self._resource_path, json=payload)
+        return True
+
+    def enable_keep_alive(self, config: Optional["Config"] = None, interval: Optional[float] = None) -> Optional[KeepAlive]:
+        """Starts sending liveness signals in the background until the execution is completed
+
+        Args:
+            config (Optional[Config], optional): Start configuration, the service is only
+            started when its `keepAlive` is set. Defaults to None.
+            interval (Optional[float], optional): Time in seconds between signals. Defaults to
+            the `keepAliveInterval` of the configuration, or 30.
+
+        Returns:
+            Optional[KeepAlive]: The keep-alive service, None if the configuration disables it
+        """
+        if config is not None and not config.keepAlive:
+            return None
+        if interval is None:
+            interval = (config.keepAliveInterval if config is not None else None) or 30
+
+        self.disable_keep_alive()
+        self._keep_alive = KeepAlive(self, interval=interval).start()
+        return self._keep_alive
+
+    def disable_keep_alive(self):
+        keep_alive, self._keep_alive = self._keep_alive, None
+        if keep_alive is not None:
+            keep_alive.stop()
 
     def set_total_task_count(self, total_task_count: int) -> dict[str, Any]:
         """Update the total number of tasks to be processed 
@@ -78,6 +221,25 @@ class Execution:
         """
         return self._update(current_task_count=current_task_count)
 
+    def progress_tracker(
+            self,
+            total: Optional[int] = None,
+            interval: float = 1.0,
+            percent: float = 1.0,
+        ) -> ProgressTracker:
+        """Creates a tracker that updates the number of processed tasks with throttling
+
+        Args:
+            total (Optional[int], optional): Total number of tasks, sent right away when given. Defaults to None.
+            interval (float, optional): Minimum time in seconds between updates. Defaults to 1.0.
+            percent (float, optional): Progress, in percent of `total`, that triggers an update
+            before `interval` elapses. Defaults to 1.0.
+
+        Returns:
+            ProgressTracker: Tracker whose `increment` is called after each task and `finish` at the end
+        """
+        return ProgressTracker(self, total=total, interval=interval, percent=percent)
+
     def update_observation(self, observation: str) -> dict[str, Any]:
         """Updates the execution observation text
 
@@ -141,6 +303,9 @@ class Execution:
 
         Returns:
             dict: Dictionary containing the information of the current execution
+
+        Raises:
+            Exception: An output sink failed to close, the status was not sent.
         """
         return self._update(ExecutionStatus.FINISHED, observation=observation)
 
@@ -152,5 +317,8 @@ class Execution:
 
         Returns:
             dict: Dictionary containing the information of the current execution
+
+        Raises:
+            Exception: An output sink failed to close, the status was not sent.
         """
         return self._update(ExecutionStatus.INTERRUPTED, observation=observation)
@@ -0,0 +1,232 @@
+from zsynctech_studio_sdk import codec
+from typing import Callable, Optional
+from collections import deque
+from bisect import bisect_left
+import threading
+import time
+import os
+
+DURATION_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0, 3600.0)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+SUCCESS_STATUSES = frozenset({"SUCCESS", "FINISHED"})
+
+
+class Histogram:
+    def __init__(self, buckets: tuple[float, ...]):
+        """Cumulative histogram in the Prometheus format
+
+        Args:
+            buckets (tuple[float, ...]): Upper bounds of the buckets, in ascending order.
+        """
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+
+def _span_id(entity_id: str) -> str:
+    return entity_id.replace("-", "")[16:]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(**labels: str) -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in labels.items() if value is not None]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Instrumentation:
+    def __init__(
+            self,
+            span_exporter: Optional[Callable[[list[dict]], None]] = None,
+            max_spans: int = 10000,
+        ):
+        """Local timing and metrics of Executions, Tasks, Steps and gateway requests
+
+        Durations are measured with the monotonic clock from the creation of each
+        entity until it reaches a completed status.
+
+        Args:
+            span_exporter (Optional[Callable[[list[dict]], None]], optional): Function that
+            receives the finished spans on `export_spans`. Defaults to None.
+            max_spans (int, optional): Maximum number of finished spans kept until exported,
+            0 disables spans. Defaults to 10000.
+        """
+        self._span_exporter = span_exporter
+        self._spans = deque(maxlen=max_spans) if max_spans else None
+        self._durations = {}
+        self._outcomes = {}
+        self._gateway_latency = Histogram(LATENCY_BUCKETS)
+        self._metrics = {}
+        self._trace_ids = {}
+        self._lock = threading.Lock()
+
+    def add_metric(self, name: str, read: Callable[[], float], metric_type: str = "gauge"):
+        """Registers a metric read when the metrics are exported
+
+        Args:
+            name (str): Metric name.
+            read (Callable[[], float]): Function that returns the current value.
+            metric_type (str, optional): Prometheus type, "gauge" or "counter". Defaults to "gauge".
+        """
+        self._metrics[name] = (read, metric_type)
+
+    def link(self, task_id: str, execution_id: str):
+        """Registers the execution of a running task, so its steps share the execution trace"""
+        with self._lock:
+            self._trace_ids[task_id] = execution_id
+
+    def observe_gateway(self, latency: float):
+        with self._lock:
+            self._gateway_latency.observe(latency)
+
+    def record(
+            self,
+            kind: str,
+            entity_id: str,
+            status: str,
+            started: int,
+            parent_id: Optional[str] = None,
+            code: Optional[str] = None,
+        ):
+        """Records an entity that reached a completed status
+
+        Args:
+            kind (str): "execution", "task" or "step".
+            entity_id (str): Entity id.
+            status (str): Completed status.
+            started (int): `time.monotonic_ns()` when the entity was created.
+            parent_id (Optional[str], optional): Id of the execution of a task or of the task of a step. Defaults to None.
+            code (Optional[str], optional): Step code. Defaults to None.
+        """
+        elapsed = time.monotonic_ns() - started
+        duration = elapsed / 1e9
+        with self._lock:
+            histogram = self._durations.get((kind, code))
+            if histogram is None:
+                histogram = self._durations[(kind, code)] = Histogram(DURATION_BUCKETS)
+            histogram.observe(duration)
+            key = (kind, code, str(status))
+            self._outcomes[key] = self._outcomes.get(key, 0) + 1
+
+            if kind == "task":
+                trace_id = self._trace_ids.pop(entity_id, parent_id)
+            elif kind == "step":
+                trace_id = self._trace_ids.get(parent_id, parent_id)
+            else:
+                trace_id = entity_id
+
+            if self._spans is not None:
+                ended = time.time_ns()
+                attributes = {"zsynctech.id": entity_id, "zsynctech.status": str(status)}
+                if code is not None:
+                    attributes["zsynctech.step_code"] = code
+                self._spans.append({
+                    "traceId": trace_id.replace("-", ""),
+                    "spanId": _span_id(entity_id),
+                    "parentSpanId": _span_id(parent_id) if parent_id else "",
+                    "name": f"{kind} {code}" if code else kind,
+                    "startTimeUnixNano": ended - elapsed,
+                    "endTimeUnixNano": ended,
+                    "attributes": [
+                        {"key": name, "value": {"stringValue": value}}
+                        for name, value in attributes.items()
+                    ],
+                    "status": {"code": 1 if str(status) in SUCCESS_STATUSES else 2},
+                })
+
+    def export_spans(self) -> list[dict]:
+        """Removes the finished spans and passes them to the span exporter
+
+        Spans follow the OTLP JSON span layout, so they can be forwarded to an
+        OpenTelemetry collector as they are.
+
+        Returns:
+            list[dict]: The exported spans
+        """
+        if self._spans is None:
+            return []
+        with self._lock:
+            spans = list(self._spans)
+            self._spans.clear()
+        if spans and self._span_exporter is not None:
+            self._span_exporter(spans)
+        return spans
+
+    def prometheus_text(self) -> str:
+        """Renders every metric in the Prometheus text exposition format
+
+        Returns:
+            str: The metrics, ready to be served or written to a textfile collector
+        """
+        lines = []
+        with self._lock:
+            durations = sorted(self._durations.items(), key=lambda item: (item[0][0], item[0][1] or ""))
+            for kind in sorted({kind for (kind, _), _ in durations}):
+                name = f"zsynctech_{kind}_duration_seconds"
+                lines.append(f"# HELP {name} Time from creation until the {kind} completed.")
+                lines.append(f"# TYPE {name} histogram")
+                for (entity_kind, code), histogram in durations:
+                    if entity_kind == kind:
+                        lines.extend(self._histogram_lines(name, histogram, step_code=code))
+
+            for kind in sorted({kind for kind, _, _ in self._outcomes}):
+                name = f"zsynctech_{kind}s_total"
+                lines.append(f"# HELP {name} Completed {kind}s by status.")
+                lines.append(f"# TYPE {name} counter")
+                for (entity_kind, code, status), count in sorted(
+                        self._outcomes.items(), key=lambda item: (item[0][0], item[0][1] or "", item[0][2])):
+                    if entity_kind == kind:
+                        lines.append(f"{name}{_labels(step_code=code, status=status)} {count}")
+
+            name = "zsynctech_gateway_request_duration_seconds"
+            lines.append(f"# HELP {name} Latency of each gateway request attempt.")
+            lines.append(f"# TYPE {name} histogram")
+            lines.extend(self._histogram_lines(name, self._gateway_latency))
+
+        for name, (read, metric_type) in self._metrics.items():
+            lines.append(f"# TYPE {name} {metric_type}")
+            lines.append(f"{name} {read()}")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _histogram_lines(name: str, histogram: Histogram, **labels: Optional[str]) -> list[str]:
+        lines = []
+        cumulative = 0
+        for bound, count in zip((*histogram.buckets, "+Inf"), histogram.counts):
+            cumulative += count
+            lines.append(f"{name}_bucket{_labels(**labels, le=bound)} {cumulative}")
+        lines.append(f"{name}_sum{_labels(**labels)} {histogram.sum}")
+        lines.append(f"{name}_count{_labels(**labels)} {cumulative}")
+        return lines
+
+    def write_prometheus(self, path: str):
+        """Writes the metrics to a file atomically, e.g. for the node_exporter textfile collector
+
+        Args:
+            path (str): Destination file.
+        """
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            file.write(self.prometheus_text())
+        os.replace(temporary, path)
+
+
+class JsonLinesSpanExporter:
+    def __init__(self, path: str):
+        """Span exporter that appends each span as a JSON line to a local file
+
+        Args:
+            path (str): Destination file.
+        """
+        self._path = path
+
+    def __call__(self, spans: list[dict]):
+        with open(self._path, "ab") as file:
+            file.write(b"".join(codec.dumps(span) + b"\n" for span in spans))
@@ -0,0 +1,50 @@
+from typing import TYPE_CHECKING
+import threading
+import time
+
+if TYPE_CHECKING:
+    from zsynctech_studio_sdk.execution import Execution
+
+
+class KeepAlive:
+    def __init__(self, execution: "Execution", interval: float = 30.0):
+        """Background liveness signal of a running execution
+
+        Every `interval` seconds without other updates of the execution, its current
+        state is sent again. When the dispatcher already has updates waiting, they
+        are flushed instead, since they prove the robot is alive. The service stops
+        when the execution reaches a completed status.
+
+        Args:
+            execution (Execution): Execution kept alive.
+            interval (float, optional): Time in seconds between signals. Defaults to 30.0.
+        """
+        self._execution = execution
+        self._interval = interval
+        self._stopped = threading.Event()
+        self._worker = threading.Thread(
+            target=self._run,
+            name="zsynctech-keepalive",
+            daemon=True
+        )
+
+    @property
+    def is_running(self) -> bool:
+        return self._worker.is_alive() and not self._stopped.is_set()
+
+    def start(self) -> "KeepAlive":
+        self._worker.start()
+        return self
+
+    def stop(self):
+        self._stopped.set()
+        if self._worker.is_alive() and self._worker is not threading.current_thread():
+            self._worker.join(timeout=1)
+
+    def _run(self):
+        while not self._stopped.wait(self._interval):
+            try:
+                if not self._execution._keep_alive_signal(self._interval):
+                    return
+            except Exception as e:
+                print(f"[KeepAlive] Failed to send keep-alive of execution {self._execution.execution_id}: {e}")
@@ -1,7 +1,31 @@
-from .execution import ExecutionModel
-from .step import StepModel
-from .task import TaskModel
-from .config import Config
+from typing import TYPE_CHECKING
+import importlib
+
+if TYPE_CHECKING:
+    from .execution import ExecutionModel
+    from .step import StepModel
+    from .task import TaskModel
+    from .config import Config
+
+_LAZY_IMPORTS = {
+    "ExecutionModel": ".execution",
+    "StepModel": ".step",
+    "TaskModel": ".task",
+    "Config": ".config",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 
 __all__ = [
@@ -9,4 +33,4 @@ __all__ = [
     "StepModel",
     "TaskModel",
     "Config",
-]
\ No newline at end of file
+]
@@ -1,11 +1,10 @@
 from zsynctech_studio_sdk.enums.execution import ExecutionStatus
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 from zsynctech_studio_sdk.enums.step import StepStatus
 from zsynctech_studio_sdk.enums.task import TaskStatus
 from uuid_extensions.uuid7 import uuid7
-from typing import Optional, Union
-from datetime import datetime
-import re
+from zsynctech_studio_sdk.validation import validate_iso_timestamp, validate_uuid7
+from typing import Any, Optional, Union
 
 
 class BaseEntity(BaseModel):
@@ -18,29 +17,53 @@ class BaseEntity(BaseModel):
     status: Optional[Union[ExecutionStatus, StepStatus, TaskStatus]] = None
     endDate: Optional[str] = None
 
+    _dump_cache: Optional[dict] = PrivateAttr(default=None)
+
+    @classmethod
+    def build(cls, trusted: dict[str, Any], **values):
+        """Creates the model validating `values` and taking `trusted` as they are
+
+        Args:
+            trusted (dict[str, Any]): Values generated by the SDK, such as
+            `get_utc_now()` dates, that skip validation.
+            **values: User supplied values, validated as usual.
+        """
+        model = cls(**values)
+        model.set_trusted(**trusted)
+        return model
+
+    def set_trusted(self, **values):
+        """Assigns values generated by the SDK without running the validators"""
+        self.__dict__.update(values)
+        self.__pydantic_fields_set__.update(values)
+        self.__pydantic_private__['_dump_cache'] = None
+
+    def dump(self) -> dict:
+        """Returns `model_dump()`, cached until the next assignment
+
+        The returned dictionary is shared and must not be modified.
+        """
+        private = self.__pydantic_private__
+        if private['_dump_cache'] is None:
+            private['_dump_cache'] = self.model_dump()
+        return private['_dump_cache']
+
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        if name in self.__pydantic_fields__:
+            self.__pydantic_private__['_dump_cache'] = None
+
     @field_validator('id')
     @classmethod
     def validate_id_format(cls, v):
-        if not re.match(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', v):
-            raise ValueError('ID deve ser um UUID válido')
-        version = int(v[14], 16)
-        if version != 7:
-            raise ValueError('ID deve ser um UUID7 válido')
-        return v
+        return validate_uuid7(v)
 
     @field_validator('endDate')
     @classmethod
     def validate_end_date_format(cls, v):
         if v is None:
             return v
-        pattern = r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z$'
-        if not re.match(pattern, v):
-            raise ValueError('endDate deve estar no formato ISO 8601 com Z')
-        try:
-            datetime.fromisoformat(v.replace('Z', '+00:00'))
-        except ValueError:
-            raise ValueError('endDate deve ser uma data válida')
-        return v
+        return validate_iso_timestamp(v, 'endDate')
 
     class Config:
         extra = "forbid"
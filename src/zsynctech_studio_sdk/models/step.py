@@ -1,9 +1,8 @@
 from zsynctech_studio_sdk.models.base import BaseEntity
 from zsynctech_studio_sdk.enums.step import StepStatus
+from zsynctech_studio_sdk.validation import validate_iso_timestamp, validate_uuid7
 from pydantic import field_validator
-from datetime import datetime
 from typing import Optional
-import re
 
 
 class StepModel(BaseEntity):
@@ -13,16 +12,16 @@ class StepModel(BaseEntity):
     startDate: Optional[str] = None
     automationOnClientId: str
 
+    @field_validator('taskId')
+    @classmethod
+    def validate_task_id_format(cls, v):
+        if v is None:
+            return v
+        return validate_uuid7(v)
+
     @field_validator('startDate')
     @classmethod
-    def validate_end_date_format(cls, v):
+    def validate_start_date_format(cls, v):
         if v is None:
             return v
-        pattern = r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z$'
-        if not re.match(pattern, v):
-            raise ValueError('endDate deve estar no formato ISO 8601 com Z')
-        try:
-            datetime.fromisoformat(v.replace('Z', '+00:00'))
-        except ValueError:
-            raise ValueError('endDate deve ser uma data válida')
-        return v
+        return validate_iso_timestamp(v, 'startDate')
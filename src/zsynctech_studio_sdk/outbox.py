@@ -0,0 +1,226 @@
+from zsynctech_studio_sdk import codec
+from typing import Callable, Optional
+import threading
+import sqlite3
+import httpx
+
+
+class Outbox:
+    def __init__(
+            self,
+            path: str,
+            send: Callable[[str, dict], object],
+            max_entries: int = 100000,
+            commit_interval: float = 0.05,
+            batch_size: int = 100,
+            max_backoff: float = 60.0,
+        ):
+        """Durable append-only outbox for status updates, backed by SQLite in WAL mode
+
+        Updates are buffered in memory and written to disk in group commits, then
+        replayed to the gateway by a background drainer with retries.
+
+        Args:
+            path (str): SQLite database file.
+            send (Callable[[str, dict], object]): Function used to deliver a single payload to an endpoint.
+            max_entries (int, optional): Maximum number of stored updates, the oldest are
+            discarded past this limit. Defaults to 100000.
+            commit_interval (float, optional): Time in seconds between group commits. Defaults to 0.05.
+            batch_size (int, optional): Number of stored updates read per drain pass. Defaults to 100.
+            max_backoff (float, optional): Maximum time in seconds between retries. Defaults to 60.0.
+        """
+        self._path = path
+        self._send = send
+        self._max_entries = max_entries
+        self._commit_interval = commit_interval
+        self._batch_size = batch_size
+        self._max_backoff = max_backoff
+
+        self._buffer = []
+        # Rows taken from the buffer by the committer and not yet counted as stored
+        self._committing = 0
+        self._stored = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+        connection = self._connect()
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS outbox (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                endpoint TEXT NOT NULL,
+                entity_id TEXT NOT NULL,
+                status TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                UNIQUE (endpoint, entity_id, status)
+            )
+            """
+        )
+        self._stored = connection.execute("SELECT COUNT(*) FROM outbox").fetchone()[0]
+        connection.close()
+
+        self._committer = threading.Thread(
+            target=self._run_committer,
+            name="zsynctech-outbox-commit",
+            daemon=True
+        )
+        self._drainer = threading.Thread(
+            target=self._run_drainer,
+            name="zsynctech-outbox-drain",
+            daemon=True
+        )
+        self._committer.start()
+        self._drainer.start()
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._buffer) + self._committing + self._stored
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self._path,
+            timeout=30,
+            isolation_level=None,
+            check_same_thread=False
+        )
+        # Every group commit reaches the disk, its cost is shared by the whole group
+        connection.execute("PRAGMA synchronous=FULL")
+        return connection
+
+    def append(self, endpoint: str, payload: dict):
+        """Stores a payload to be sent to the endpoint
+
+        A stored update with the same entity `id` and status is replaced, keeping
+        its position in the replay order.
+
+        Args:
+            endpoint (str): Gateway endpoint of the entity.
+            payload (dict): Entity data.
+        """
+        row = (
+            endpoint,
+            str(payload.get("id")),
+            str(payload.get("status")),
+            codec.dumps(payload).decode(),
+        )
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Outbox is closed.")
+            self._buffer.append(row)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Writes the buffered updates to disk and waits for them to be sent
+
+        Args:
+            timeout (Optional[float], optional): Maximum time in seconds to wait for the
+            gateway to receive the updates. Defaults to None.
+
+        Returns:
+            bool: True if every update was sent
+        """
+        with self._condition:
+            self._condition.notify_all()
+            return self._condition.wait_for(
+                lambda: self.pending_count == 0,
+                timeout=timeout
+            )
+
+    def close(self, timeout: Optional[float] = None):
+        """Writes the buffered updates to disk and stops the background threads
+
+        Updates not sent within `timeout` remain stored and are replayed by the next
+        outbox opened on the same file.
+
+        Args:
+            timeout (Optional[float], optional): Maximum time in seconds to wait for the
+            stored updates to be sent. Defaults to None.
+        """
+        self.flush(timeout)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._committer.join()
+        self._drainer.join(timeout=1)
+
+    def _run_committer(self):
+        connection = self._connect()
+        while True:
+            with self._condition:
+                if not self._closed:
+                    self._condition.wait(self._commit_interval)
+                rows, self._buffer = self._buffer, []
+                self._committing = len(rows)
+                closed = self._closed
+
+            if rows:
+                connection.execute("BEGIN IMMEDIATE")
+                before = connection.execute("SELECT COUNT(*) FROM outbox").fetchone()[0]
+                connection.executemany(
+                    "INSERT INTO outbox (endpoint, entity_id, status, payload) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (endpoint, entity_id, status) DO UPDATE SET payload = excluded.payload",
+                    rows
+                )
+                after = connection.execute("SELECT COUNT(*) FROM outbox").fetchone()[0]
+                if after > self._max_entries:
+                    connection.execute(
+                        "DELETE FROM outbox WHERE seq IN (SELECT seq FROM outbox ORDER BY seq LIMIT ?)",
+                        (after - self._max_entries,)
+                    )
+                    print(f"[Outbox] Limit reached, discarded {after - self._max_entries} oldest updates.")
+                    after = self._max_entries
+                connection.execute("COMMIT")
+
+                with self._condition:
+                    self._stored += after - before
+                    self._committing = 0
+                    self._condition.notify_all()
+
+            if closed:
+                connection.close()
+                return
+
+    def _run_drainer(self):
+        connection = self._connect()
+        retry_delay = 0.0
+        while True:
+            with self._condition:
+                if not self._closed and (retry_delay or not self._stored):
+                    self._condition.wait(retry_delay or self._commit_interval)
+                if self._closed:
+                    connection.close()
+                    return
+
+            rows = connection.execute(
+                "SELECT seq, endpoint, payload FROM outbox ORDER BY seq LIMIT ?",
+                (self._batch_size,)
+            ).fetchall()
+
+            done = []
+            for seq, endpoint, payload in rows:
+                try:
+                    self._send(endpoint, codec.loads(payload))
+                except httpx.HTTPStatusError as e:
+                    if e.response.status_code >= 500 or e.response.status_code in (408, 429):
+                        retry_delay = min(max(retry_delay * 2, 1.0), self._max_backoff)
+                        print(f"[Outbox] Gateway unavailable for '{endpoint}', retrying in {retry_delay:.1f}s: {e}")
+                        break
+                    print(f"[Outbox] Update rejected by '{endpoint}', discarding: {e}")
+                except Exception as e:
+                    retry_delay = min(max(retry_delay * 2, 1.0), self._max_backoff)
+                    print(f"[Outbox] Failed to send update to '{endpoint}', retrying in {retry_delay:.1f}s: {e}")
+                    break
+                else:
+                    retry_delay = 0.0
+                done.append((seq, payload))
+
+            if done:
+                connection.execute("BEGIN IMMEDIATE")
+                # A sent row may have been replaced by a newer state of the entity in
+                # the meantime, which keeps its seq and stays stored, so only the rows
+                # whose payload was sent are deleted and counted
+                deleted = connection.executemany("DELETE FROM outbox WHERE seq = ? AND payload = ?", done).rowcount
+                connection.execute("COMMIT")
+                with self._condition:
+                    self._stored -= deleted
+                    self._condition.notify_all()
@@ -0,0 +1,171 @@
+from typing import Literal, Optional
+from collections import Counter
+import threading
+import cProfile
+import time
+import re
+import sys
+import os
+
+MAX_STACK_DEPTH = 128
+
+
+class _Session:
+    def __init__(self, step_id: str, code: str):
+        self.step_id = step_id
+        self.code = code
+        self.thread_id = threading.get_ident()
+        self.started = time.monotonic()
+        self.samples = Counter()
+        self.profile = None
+
+
+def _collapse(frame) -> str:
+    names = []
+    while frame is not None and len(names) < MAX_STACK_DEPTH:
+        code = frame.f_code
+        names.append(f"{code.co_qualname} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class StepProfiler:
+    def __init__(
+            self,
+            threshold: float,
+            directory: str = "profiles",
+            mode: Literal["sampling", "cprofile"] = "sampling",
+            interval: float = 0.01,
+            annotate_observation: bool = False,
+        ):
+        """Captures profiles of the Steps that run longer than a threshold
+
+        A watchdog thread, idle while no step runs, checks the running steps every
+        `interval` seconds, so steps faster than the threshold cost a dictionary
+        insert. In "sampling" mode it samples the stack of a step once it crosses
+        the threshold. In "cprofile" mode it turns cProfile on once a step crosses
+        the threshold, so the profile covers the rest of the step. Only one cProfile
+        can be active in the process and, since Python 3.12, it records the calls
+        of every thread, so steps that cross the threshold while another one is
+        profiled are sampled instead and the cProfile profile may include calls of
+        other threads.
+
+        Args:
+            threshold (float): Step duration in seconds after which a profile is stored.
+            directory (str, optional): Directory of the stored profiles. Defaults to "profiles".
+            mode (Literal["sampling", "cprofile"], optional): Profiler used. Defaults to "sampling".
+            interval (float, optional): Time in seconds between checks and stack samples. Defaults to 0.01.
+            annotate_observation (bool, optional): Adds the profile path to the observation
+            of the step. Defaults to False.
+        """
+        if mode not in ("sampling", "cprofile"):
+            raise ValueError(f"Unsupported profiling mode '{mode}', choose 'sampling' or 'cprofile'")
+        self._threshold = threshold
+        self._directory = directory
+        self._mode = mode
+        self._interval = interval
+        self._annotate_observation = annotate_observation
+        self._sessions = {}
+        self._profiled = None
+        self._closed = False
+        self._watchdog = None
+        self._condition = threading.Condition()
+
+    @property
+    def annotate_observation(self) -> bool:
+        return self._annotate_observation
+
+    def start(self, step_id: str, code: str) -> _Session:
+        """Starts profiling a step that runs on the calling thread"""
+        session = _Session(step_id, code)
+        with self._condition:
+            self._sessions[id(session)] = session
+            if self._watchdog is None:
+                self._watchdog = threading.Thread(
+                    target=self._run_watchdog,
+                    name="zsynctech-profiler",
+                    daemon=True
+                )
+                self._watchdog.start()
+            self._condition.notify_all()
+        return session
+
+    def stop(self, session: _Session) -> Optional[str]:
+        """Stops profiling a step and stores the profile if it crossed the threshold
+
+        Returns:
+            Optional[str]: Path of the stored profile
+        """
+        elapsed = time.monotonic() - session.started
+        with self._condition:
+            self._sessions.pop(id(session), None)
+            if session.profile is not None:
+                session.profile.disable()
+                self._profiled = None
+
+        if elapsed < self._threshold:
+            return None
+
+        name = os.path.join(self._directory, f"{re.sub(r'[^\w.-]', '_', session.code)}-{session.step_id}")
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+            if session.profile is not None:
+                path = f"{name}.prof"
+                session.profile.dump_stats(path)
+            elif session.samples:
+                path = f"{name}.folded"
+                with open(path, "w", encoding="utf-8") as file:
+                    for stack, count in session.samples.most_common():
+                        file.write(f"{stack} {count}\n")
+            else:
+                return None
+        except OSError as e:
+            print(f"[StepProfiler] Failed to store the profile of step '{session.code}': {e}")
+            return None
+
+        print(f"[StepProfiler] Step '{session.code}' took {elapsed:.2f}s, profile stored in {path}")
+        return path
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1)
+
+    def _enable_cprofile(self, session: _Session) -> bool:
+        if self._profiled is not None:
+            return False
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Another profiler, e.g. of the robot itself, is already active
+            return False
+        session.profile = self._profiled = profile
+        return True
+
+    def _run_watchdog(self):
+        with self._condition:
+            while not self._closed:
+                if not self._sessions:
+                    # Idle until a step starts
+                    self._condition.wait()
+                    continue
+                self._condition.wait(self._interval)
+
+                now = time.monotonic()
+                due = [
+                    session for session in self._sessions.values()
+                    if session.profile is None and now - session.started >= self._threshold
+                ]
+                if not due:
+                    continue
+                if self._mode == "cprofile":
+                    # A step already sampled keeps being sampled, so its profile stays whole
+                    due = [session for session in due if session.samples or not self._enable_cprofile(session)]
+                frames = sys._current_frames()
+                for session in due:
+                    frame = frames.get(session.thread_id)
+                    if frame is not None:
+                        session.samples[_collapse(frame)] += 1
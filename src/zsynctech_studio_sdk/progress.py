@@ -0,0 +1,95 @@
+from typing import TYPE_CHECKING, Optional
+import threading
+import itertools
+import math
+import time
+
+if TYPE_CHECKING:
+    from zsynctech_studio_sdk.execution import Execution
+
+
+class ProgressTracker:
+    def __init__(
+            self,
+            execution: "Execution",
+            total: Optional[int] = None,
+            interval: float = 1.0,
+            percent: float = 1.0,
+        ):
+        """Throttled reporting of the processed task count of an execution
+
+        Workers call `increment` after each item; the count is published at most
+        once every `interval` seconds or every `percent` of `total`, whichever
+        comes first, and `finish` always publishes the final count. Increments
+        never wait for a publication in progress. When the count passes the total
+        of the execution, e.g. when the total is unknown, the total is raised with
+        it, so the progress of streamed items is still published as they arrive.
+
+        Args:
+            execution (Execution): Execution whose `currentTaskCount` is updated.
+            total (Optional[int], optional): Total number of items, also published as the
+            `totalTaskCount` of the execution. Defaults to None.
+            interval (float, optional): Minimum time in seconds between publications. Defaults to 1.0.
+            percent (float, optional): Progress, in percent of `total`, that triggers a
+            publication before `interval` elapses. Defaults to 1.0.
+        """
+        self._execution = execution
+        self._interval = interval
+        self._step = max(1, math.ceil(total * percent / 100)) if total else None
+        self._counter = itertools.count(1)
+        self._count = 0
+        self._published = 0
+        self._final = None
+        self._count_lock = threading.Lock()
+        self._next_count = self._step or math.inf
+        self._next_time = time.monotonic() + interval
+        self._publishing = threading.Lock()
+
+        if total is not None:
+            execution.set_total_task_count(total)
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def increment(self) -> int:
+        """Counts one processed item
+
+        Returns:
+            int: The processed count after this item
+        """
+        value = next(self._counter)
+        with self._count_lock:
+            if value > self._count:
+                self._count = value
+        if value >= self._next_count or time.monotonic() >= self._next_time:
+            if self._publishing.acquire(blocking=False):
+                try:
+                    self._publish(self._count)
+                finally:
+                    self._publishing.release()
+        return value
+
+    def _publish(self, value: int):
+        if value <= self._published:
+            return
+        if value > (self._execution._current_execution.totalTaskCount or 0):
+            self._execution._update(total_task_count=value, current_task_count=value)
+        else:
+            self._execution.update_current_task_count(value)
+        self._published = value
+        if self._step is not None:
+            self._next_count = value + self._step
+        self._next_time = time.monotonic() + self._interval
+
+    def finish(self) -> int:
+        """Publishes the final count, once every increment has returned
+
+        Returns:
+            int: The final processed count
+        """
+        with self._publishing:
+            if self._final is None:
+                self._final = self._count = next(self._counter) - 1
+            self._publish(self._final)
+        return self._final
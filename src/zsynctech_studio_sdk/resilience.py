@@ -0,0 +1,159 @@
+from dataclasses import dataclass
+import threading
+import random
+import httpx
+import time
+
+
+class CircuitOpenError(RuntimeError):
+    pass
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Retry of failed gateway requests with jittered exponential backoff
+
+    Attributes:
+        max_attempts (int): Maximum number of attempts per request, including the first one.
+        backoff_base (float): Delay in seconds before the first retry.
+        backoff_max (float): Maximum delay in seconds between attempts.
+        retry_methods (frozenset[str]): Methods considered idempotent and safe to retry.
+        retry_statuses (frozenset[int]): Response statuses that are retried.
+    """
+    max_attempts: int = 3
+    backoff_base: float = 0.2
+    backoff_max: float = 5.0
+    retry_methods: frozenset[str] = frozenset({"GET", "POST", "PUT", "PATCH", "DELETE"})
+    retry_statuses: frozenset[int] = frozenset({408, 429, 500, 502, 503, 504})
+
+    def should_retry(self, method: str, error: Exception, attempt: int) -> bool:
+        if attempt >= self.max_attempts or method.upper() not in self.retry_methods:
+            return False
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in self.retry_statuses
+        return isinstance(error, httpx.TransportError)
+
+    def delay(self, attempt: int) -> float:
+        """Full jitter delay before the retry that follows `attempt`"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+
+
+def is_gateway_failure(error: Exception) -> bool:
+    """Tells whether the error means the gateway is unhealthy rather than the request invalid"""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500 or error.response.status_code in (408, 429)
+    return isinstance(error, httpx.TransportError)
+
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """Fails requests fast once the gateway is clearly unhealthy
+
+        After `failure_threshold` consecutive failures the circuit opens and requests
+        are rejected with `CircuitOpenError`. After `reset_timeout` seconds a single
+        trial request is allowed; its outcome closes or reopens the circuit.
+
+        Args:
+            failure_threshold (int, optional): Consecutive failures that open the circuit. Defaults to 5.
+            reset_timeout (float, optional): Time in seconds the circuit stays open. Defaults to 30.0.
+        """
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._trial_running or time.monotonic() - self._opened_at < self._reset_timeout:
+                return False
+            self._trial_running = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._trial_running or self._failures >= self._failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial_running = False
+
+    def record_neutral(self):
+        """Ends a request whose outcome says nothing about the gateway health, e.g. a 4xx"""
+        with self._lock:
+            self._trial_running = False
+
+
+class RequestMetrics:
+    def __init__(self):
+        """Counters of the gateway requests made by a client"""
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.requests = 0
+            self.attempts = 0
+            self.retries = 0
+            self.failures = 0
+            self.rejected = 0
+            self.resyncs = 0
+            self.latency_total = 0.0
+            self.latency_max = 0.0
+            self.retry_wait_total = 0.0
+
+    def record_attempt(self, latency: float):
+        with self._lock:
+            self.attempts += 1
+            self.latency_total += latency
+            if latency > self.latency_max:
+                self.latency_max = latency
+
+    def record_retry(self, wait: float):
+        with self._lock:
+            self.retries += 1
+            self.retry_wait_total += wait
+
+    def record_resync(self):
+        with self._lock:
+            self.resyncs += 1
+
+    def record_request(self, failed: bool = False, rejected: bool = False):
+        with self._lock:
+            self.requests += 1
+            if failed:
+                self.failures += 1
+            if rejected:
+                self.rejected += 1
+
+    def snapshot(self) -> dict[str, float]:
+        """Returns a copy of the counters
+
+        Returns:
+            dict[str, float]: Request, attempt, retry, failure, rejection and full resync
+            counts, plus total and maximum attempt latency and total retry wait in seconds
+        """
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "attempts": self.attempts,
+                "retries": self.retries,
+                "failures": self.failures,
+                "rejected": self.rejected,
+                "resyncs": self.resyncs,
+                "latency_total": self.latency_total,
+                "latency_max": self.latency_max,
+                "retry_wait_total": self.retry_wait_total,
+            }
@@ -0,0 +1,206 @@
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from zsynctech_studio_sdk.execution import Execution
+from zsynctech_studio_sdk.sinks import OutputSink
+from zsynctech_studio_sdk.checkpoint import CheckpointStore
+from typing import Any, Callable, Iterable, Literal, Optional
+from zsynctech_studio_sdk.task import Task
+import functools
+import threading
+
+
+class TaskRunner:
+    def __init__(
+            self,
+            execution: Execution,
+            worker: Callable[[Any, str], Any],
+            max_workers: int = 4,
+            executor: Literal["thread", "process"] = "thread",
+            max_in_flight: Optional[int] = None,
+            code: Optional[Callable[[Any], str]] = None,
+            description: Optional[Callable[[Any], str]] = None,
+            progress_interval: float = 1.0,
+            progress_percent: float = 1.0,
+            sink: Optional[OutputSink] = None,
+            checkpoint: Optional[CheckpointStore] = None,
+        ):
+        """Runs each work item inside a Task using a thread or process pool
+
+        Args:
+            execution (Execution): Execution the tasks belong to.
+            worker (Callable[[Any, str], Any]): Function called with the work item and the task id.
+            Must be picklable when `executor` is "process".
+            max_workers (int, optional): Number of workers in the pool. Defaults to 4.
+            executor (Literal["thread", "process"], optional): Pool type. Defaults to "thread".
+            max_in_flight (Optional[int], optional): Maximum number of items submitted and not yet
+            finished. Defaults to twice `max_workers`.
+            code (Optional[Callable[[Any], str]], optional): Builds the task code from the item. Defaults to None.
+            description (Optional[Callable[[Any], str]], optional): Builds the task description from the item.
+            Defaults to None.
+            progress_interval (float, optional): Minimum time in seconds between updates of the
+            processed count of the execution. Defaults to 1.0.
+            progress_percent (float, optional): Progress, in percent of the total, that updates the
+            processed count before `progress_interval` elapses. Defaults to 1.0.
+            sink (Optional[OutputSink], optional): Receives the value returned by the worker for
+            each successful item, unless it is None. Defaults to None.
+            checkpoint (Optional[CheckpointStore], optional): Records the code of each successful
+            item once its result is written to the sink, and items whose code was already recorded
+            for the execution are skipped. Requires `code` and, with a sink, a resumable one, e.g.
+            a `FileSink` with `resume=True`. Defaults to None.
+        """
+        if executor not in ("thread", "process"):
+            raise ValueError("executor must be 'thread' or 'process'")
+        if checkpoint is not None and code is None:
+            raise ValueError("checkpoint requires code to identify the items")
+        if checkpoint is not None and sink is not None and not sink.resumable:
+            raise ValueError(
+                "checkpoint requires a resumable sink, e.g. a FileSink with resume=True, "
+                "the results of skipped items would be lost"
+            )
+
+        self._execution = execution
+        self._worker = worker
+        self._max_workers = max_workers
+        self._executor = executor
+        self._code = code
+        self._description = description
+        self._slots = threading.BoundedSemaphore(max_in_flight or max_workers * 2)
+        self._progress_interval = progress_interval
+        self._progress_percent = progress_percent
+        self._progress = None
+        self._sink = sink
+        self._checkpoint = checkpoint
+
+        self._lock = threading.Lock()
+        self._processed = 0
+        self._success = 0
+        self._fail = 0
+        self._skipped = 0
+        self._sink_error = None
+        # Codes of the successful items whose results are still buffered in the sink
+        self._unwritten = []
+        self._sink_lock = threading.Lock()
+
+    def _create_task(self, item: Any, code: Optional[str]) -> Task:
+        return Task(
+            execution_id=self._execution.execution_id,
+            code=code,
+            description=self._description(item) if self._description else None,
+            client=self._execution._client,
+        )
+
+    def _run_in_task(self, item: Any, code: Optional[str]):
+        with self._create_task(item, code) as task:
+            return self._worker(item, task.task_id)
+
+    def _submit(self, pool: Executor, item: Any, code: Optional[str]) -> Future:
+        if self._executor == "thread":
+            return pool.submit(self._run_in_task, item, code)
+
+        task = self._create_task(item, code)
+        task.start()
+        future = pool.submit(self._worker, item, task.task_id)
+
+        def _finish_task(future: Future):
+            exc = future.exception()
+            if exc is not None:
+                task.fail(observation=str(exc))
+            else:
+                task.success()
+
+        future.add_done_callback(_finish_task)
+        return future
+
+    def _on_done(self, code: Optional[str], future: Future):
+        try:
+            with self._lock:
+                self._processed += 1
+                if future.exception() is None:
+                    self._success += 1
+                else:
+                    self._fail += 1
+            if future.exception() is None:
+                self._record_result(code, future.result())
+            self._progress.increment()
+        finally:
+            self._slots.release()
+
+    def _record_result(self, code: Optional[str], result: Any):
+        if self._sink is None or result is None:
+            if self._checkpoint is not None:
+                self._checkpoint.mark_done(self._execution.execution_id, code)
+            return
+
+        with self._sink_lock:
+            if self._checkpoint is not None:
+                self._unwritten.append(code)
+            try:
+                written = self._sink.write(result)
+            except Exception as e:
+                # The result stays buffered unless the sink is closed, `run` reports it
+                print(f"[TaskRunner] Failed to write the result of '{code}' to the output sink: {e}")
+                self._sink_error = self._sink_error or e
+                return
+            if written:
+                self._mark_written()
+
+    def _mark_written(self):
+        for code in self._unwritten:
+            self._checkpoint.mark_done(self._execution.execution_id, code)
+        self._unwritten.clear()
+
+    def run(self, items: Iterable[Any], total: Optional[int] = None) -> dict[str, int]:
+        """Processes every item and waits for all of them to finish
+
+        Args:
+            items (Iterable[Any]): Work items, consumed lazily.
+            total (Optional[int], optional): Total number of items. When omitted, `len(items)`
+            is used if available. Defaults to None.
+
+        Returns:
+            dict[str, int]: Number of processed, successful, failed and skipped items
+
+        Raises:
+            Exception: The buffered results could not be written to the output sink.
+            RuntimeError: Results were lost because the output sink was closed during the run.
+        """
+        if total is None and hasattr(items, "__len__"):
+            total = len(items)
+        self._progress = self._execution.progress_tracker(
+            total=total,
+            interval=self._progress_interval,
+            percent=self._progress_percent,
+        )
+
+        pool_class = ThreadPoolExecutor if self._executor == "thread" else ProcessPoolExecutor
+        with pool_class(max_workers=self._max_workers) as pool:
+            for item in items:
+                code = self._code(item) if self._code else None
+                if self._checkpoint is not None and self._checkpoint.is_done(self._execution.execution_id, code):
+                    with self._lock:
+                        self._skipped += 1
+                    self._progress.increment()
+                    continue
+
+                self._slots.acquire()
+                try:
+                    future = self._submit(pool, item, code)
+                except BaseException:
+                    self._slots.release()
+                    raise
+                future.add_done_callback(functools.partial(self._on_done, code))
+
+        try:
+            if self._sink is not None:
+                with self._sink_lock:
+                    self._sink.flush()
+                    self._mark_written()
+        finally:
+            self._progress.finish()
+        if self._sink_error is not None and self._sink.closed:
+            raise RuntimeError("Results were lost, the output sink was closed during the run") from self._sink_error
+        return {
+            "processed": self._processed,
+            "success": self._success,
+            "fail": self._fail,
+            "skipped": self._skipped,
+        }
@@ -0,0 +1,471 @@
+from zsynctech_studio_sdk.utils import Format, detect_format, metadata_options
+from zsynctech_studio_sdk.models.config import InputOutputTypes
+from zsynctech_studio_sdk import codec
+from typing import TYPE_CHECKING, Any, Iterable, Literal, Optional
+from urllib.parse import unquote, urlsplit
+from abc import ABC, abstractmethod
+import tempfile
+import threading
+import csv
+import io
+import os
+
+if TYPE_CHECKING:
+    from zsynctech_studio_sdk.execution import Execution
+    from zsynctech_studio_sdk.models import Config
+
+
+class OutputSink(ABC):
+    def __init__(self, batch_size: int = 1000):
+        """Buffered writer of the output records of an execution
+
+        Records are kept in memory and written in batches of `batch_size`, so each
+        batch costs a single write or round trip. A batch that fails to be written
+        stays buffered and is written again with the next batch, and the error is
+        raised to the caller. `close` writes the remaining records and completes
+        the output, while `suspend` only writes them, e.g. when the execution is
+        interrupted, so a later sink can resume the output. Safe to share between
+        worker threads.
+
+        Args:
+            batch_size (int, optional): Number of records per write. Defaults to 1000.
+        """
+        self._batch_size = batch_size
+        self._buffer = []
+        self._closed = False
+        self._lock = threading.Lock()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def resumable(self) -> bool:
+        """Whether the records written before `suspend` survive the process, so a later run can add to them"""
+        return True
+
+    def write(self, record: Any) -> bool:
+        """Adds a record to the output, e.g. the result of a Task
+
+        Returns:
+            bool: True if this record and every record before it were written
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("The output sink is closed")
+            self._buffer.append(record)
+            if len(self._buffer) >= self._batch_size:
+                self._flush()
+                return True
+            return False
+
+    def write_many(self, records: Iterable[Any]):
+        for record in records:
+            self.write(record)
+
+    def flush(self):
+        """Writes the buffered records"""
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        if self._buffer:
+            # Cleared only once written, so a failed batch is not lost
+            self._write_batch(self._buffer)
+            self._buffer = []
+
+    def suspend(self):
+        """Writes the buffered records without completing the output"""
+        self.flush()
+
+    def close(self):
+        """Writes the buffered records and completes the output"""
+        with self._lock:
+            if self._closed:
+                return
+            self._flush()
+            # Closed only once completed, so a failed close can be retried
+            self._finish()
+            self._closed = True
+
+    @abstractmethod
+    def _write_batch(self, batch: list):
+        """Writes a batch of records, raising if none of them may be considered written"""
+
+    def _finish(self):
+        pass
+
+    def __enter__(self) -> "OutputSink":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class MemorySink(OutputSink):
+    def __init__(self, batch_size: int = 1000):
+        """Output sink that keeps the records in memory, a stand-in for the other sinks in tests
+
+        Args:
+            batch_size (int, optional): Number of records per write. Defaults to 1000.
+        """
+        super().__init__(batch_size)
+        self.records = []
+        self.batches = 0
+
+    @property
+    def resumable(self) -> bool:
+        return False
+
+    def _write_batch(self, batch: list):
+        self.records.extend(batch)
+        self.batches += 1
+
+
+class _EncodedSink(OutputSink):
+    def __init__(
+            self,
+            path: str,
+            format: Optional[Format],
+            encoding: str,
+            delimiter: str,
+            fieldnames: Optional[list[str]],
+            batch_size: int,
+        ):
+        super().__init__(batch_size)
+        self._path = path
+        self._format = format or detect_format(path)
+        self._encoding = encoding
+        self._delimiter = delimiter
+        self._fieldnames = fieldnames
+        self._header_written = False
+        if self._format not in ("json", "csv", "text"):
+            raise ValueError(f"Unsupported output format '{self._format}', choose 'json', 'csv' or 'text'")
+
+    def _encode(self, batch: list) -> bytes:
+        if self._format == "json":
+            return b"".join(codec.dumps(record) + b"\n" for record in batch)
+        if self._format == "text":
+            return "".join(f"{record}\n" for record in batch).encode(self._encoding)
+
+        text = io.StringIO()
+        if self._fieldnames is None:
+            self._fieldnames = list(batch[0])
+        writer = csv.DictWriter(text, self._fieldnames, delimiter=self._delimiter, lineterminator="\n")
+        if not self._header_written:
+            writer.writeheader()
+        writer.writerows(batch)
+        return text.getvalue().encode(self._encoding)
+
+
+class FileSink(_EncodedSink):
+    OPTIONS = ("format", "encoding", "delimiter", "fieldnames", "batch_size", "resume")
+
+    def __init__(
+            self,
+            path: str,
+            format: Optional[Format] = None,
+            encoding: str = "utf-8",
+            delimiter: str = ",",
+            fieldnames: Optional[list[str]] = None,
+            batch_size: int = 1000,
+            resume: bool = False,
+        ):
+        """Output sink that writes a local file atomically
+
+        Batches are written to a `.partial` file next to `path`, which replaces
+        `path` on `close`, so readers never see a partial output. A suspended
+        output stays in the `.partial` file for a resumed run to continue.
+
+        Args:
+            path (str): File path.
+            format (Optional[Format], optional): "json" for one JSON document per line, "csv"
+            for dictionaries written as rows or "text" for lines. Defaults to the file extension.
+            encoding (str, optional): File encoding. Defaults to "utf-8".
+            delimiter (str, optional): CSV delimiter. Defaults to ",".
+            fieldnames (Optional[list[str]], optional): CSV columns. Defaults to the keys of the first record.
+            batch_size (int, optional): Number of records per write. Defaults to 1000.
+            resume (bool, optional): Continues the partial output of a suspended run instead
+            of starting a new one. Defaults to False.
+        """
+        super().__init__(path, format, encoding, delimiter, fieldnames, batch_size)
+        self._temporary = f"{path}.partial"
+        self._resume = resume
+        self._append = resume
+        self._file = None
+
+    @property
+    def resumable(self) -> bool:
+        return self._resume
+
+    def _open(self):
+        if self._file is None:
+            self._file = open(self._temporary, "ab" if self._append else "wb")
+            self._append = True
+            if self._file.tell():
+                self._header_written = True
+
+    def _write_batch(self, batch: list):
+        self._open()
+        self._file.write(self._encode(batch))
+        # On disk before the batch is reported as written, so checkpoints never get ahead of the output
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._header_written = True
+
+    def _sync(self):
+        with self._file:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        self._file = None
+
+    def suspend(self):
+        with self._lock:
+            self._flush()
+            if self._file is not None:
+                self._sync()
+
+    def _finish(self):
+        self._open()
+        self._sync()
+        os.replace(self._temporary, self._path)
+
+
+class FtpSink(_EncodedSink):
+    OPTIONS = (
+        "host", "user", "password", "port", "tls", "timeout",
+        "format", "encoding", "delimiter", "fieldnames", "batch_size",
+    )
+
+    def __init__(
+            self,
+            host: str,
+            path: str,
+            user: str = "anonymous",
+            password: str = "",
+            port: int = 21,
+            tls: bool = False,
+            timeout: float = 30.0,
+            format: Optional[Format] = None,
+            encoding: str = "utf-8",
+            delimiter: str = ",",
+            fieldnames: Optional[list[str]] = None,
+            batch_size: int = 1000,
+        ):
+        """Output sink that uploads a file to an FTP server
+
+        Batches are spooled to a local temporary file. On `close` it is uploaded
+        under a temporary name and renamed to `path`, so readers never see a partial output.
+        The spool is kept until the upload succeeds, so a failed `close` can be retried,
+        but it does not survive the process, so a suspended output cannot be resumed.
+
+        Args:
+            host (str): Server host.
+            path (str): File path on the server.
+            user (str, optional): User name. Defaults to "anonymous".
+            password (str, optional): Password. Defaults to "".
+            port (int, optional): Server port. Defaults to 21.
+            tls (bool, optional): Uses FTPS with a protected data connection. Defaults to False.
+            timeout (float, optional): Connection timeout in seconds. Defaults to 30.0.
+            format (Optional[Format], optional): Record format, see `FileSink`. Defaults to the file extension.
+            encoding (str, optional): File encoding. Defaults to "utf-8".
+            delimiter (str, optional): CSV delimiter. Defaults to ",".
+            fieldnames (Optional[list[str]], optional): CSV columns. Defaults to the keys of the first record.
+            batch_size (int, optional): Number of records per write. Defaults to 1000.
+        """
+        super().__init__(path, format, encoding, delimiter, fieldnames, batch_size)
+        self._host = host
+        self._user = user
+        self._password = password
+        self._port = port
+        self._tls = tls
+        self._timeout = timeout
+        self._spool = tempfile.TemporaryFile()
+
+    @property
+    def resumable(self) -> bool:
+        return False
+
+    def _write_batch(self, batch: list):
+        self._spool.write(self._encode(batch))
+        self._header_written = True
+
+    def _finish(self):
+        import ftplib
+
+        self._spool.seek(0)
+        try:
+            ftp = ftplib.FTP_TLS() if self._tls else ftplib.FTP()
+            ftp.connect(self._host, self._port, timeout=self._timeout)
+            try:
+                ftp.login(self._user, self._password)
+                if self._tls:
+                    ftp.prot_p()
+                temporary = f"{self._path}.tmp"
+                ftp.storbinary(f"STOR {temporary}", self._spool)
+                ftp.rename(temporary, self._path)
+                ftp.quit()
+            finally:
+                ftp.close()
+        except BaseException:
+            # Later batches are appended to the spool again until the upload is retried
+            self._spool.seek(0, os.SEEK_END)
+            raise
+        self._spool.close()
+
+
+class HttpSink(OutputSink):
+    OPTIONS = ("headers", "timeout", "batch_size")
+
+    def __init__(
+            self,
+            url: str,
+            headers: Optional[dict] = None,
+            timeout: float = 30.0,
+            batch_size: int = 1000,
+        ):
+        """Output sink that POSTs each batch as a JSON array
+
+        Args:
+            url (str): Output URL.
+            headers (Optional[dict], optional): Request headers. Defaults to None.
+            timeout (float, optional): Request timeout in seconds. Defaults to 30.0.
+            batch_size (int, optional): Number of records per request. Defaults to 1000.
+        """
+        super().__init__(batch_size)
+        self._url = url
+        self._headers = {"Content-Type": "application/json", **(headers or {})}
+        self._timeout = timeout
+        self._client = None
+
+    def _write_batch(self, batch: list):
+        import httpx
+
+        if self._client is None:
+            self._client = httpx.Client(headers=self._headers, timeout=self._timeout)
+        self._client.post(self._url, content=codec.dumps(batch)).raise_for_status()
+
+    def _finish(self):
+        if self._client is not None:
+            self._client.close()
+
+
+class QueueSink(OutputSink):
+    OPTIONS = ("exchange", "format", "encoding", "batch_size")
+
+    def __init__(
+            self,
+            url: str,
+            queue: str,
+            exchange: str = "",
+            format: Literal["json", "text"] = "json",
+            encoding: str = "utf-8",
+            batch_size: int = 1000,
+        ):
+        """Output sink that publishes each record as a persistent RabbitMQ message
+
+        Each batch is published in a single AMQP transaction, so the broker
+        confirms a whole batch with one round trip instead of one per message.
+
+        Args:
+            url (str): RabbitMQ connection URL.
+            queue (str): Routing key, the queue name when publishing to the default exchange.
+            exchange (str, optional): Exchange. Defaults to the default exchange.
+            format (Literal["json", "text"], optional): "json" for JSON messages or "text". Defaults to "json".
+            encoding (str, optional): Encoding of text messages. Defaults to "utf-8".
+            batch_size (int, optional): Number of messages per transaction. Defaults to 1000.
+        """
+        if format not in ("json", "text"):
+            raise ValueError(f"Unsupported queue format '{format}', choose 'json' or 'text'")
+        super().__init__(batch_size)
+        self._url = url
+        self._queue = queue
+        self._exchange = exchange
+        self._format = format
+        self._encoding = encoding
+        self._connection = None
+        self._channel = None
+
+    def _write_batch(self, batch: list):
+        import pika
+
+        if self._connection is None:
+            self._connection = pika.BlockingConnection(pika.URLParameters(self._url))
+            self._channel = self._connection.channel()
+            self._channel.tx_select()
+
+        properties = pika.BasicProperties(
+            content_type="application/json" if self._format == "json" else "text/plain",
+            delivery_mode=pika.DeliveryMode.Persistent,
+        )
+        try:
+            for record in batch:
+                body = codec.dumps(record) if self._format == "json" else str(record).encode(self._encoding)
+                self._channel.basic_publish(self._exchange, self._queue, body, properties)
+            self._channel.tx_commit()
+        except Exception:
+            # The uncommitted messages are discarded by the broker, the batch is
+            # published again on a new connection
+            connection, self._connection = self._connection, None
+            try:
+                if connection.is_open:
+                    connection.close()
+            except Exception:
+                pass
+            raise
+
+    def _finish(self):
+        if self._connection is not None and self._connection.is_open:
+            self._connection.close()
+
+
+def open_output(config: "Config", execution: Optional["Execution"] = None, **options: Any) -> OutputSink:
+    """Opens the output described by `outputType`, `outputPath` and `outputMetaData` of a start config
+
+    The output is resolved like the input in `open_input`. API outputs receive
+    each batch as a JSON array.
+
+    Args:
+        config (Config): Start configuration of the execution.
+        execution (Optional[Execution], optional): Execution that closes the sink when it is
+        finished or fails. Defaults to None.
+
+    Returns:
+        OutputSink: The output sink
+    """
+    if not config.outputPath:
+        raise ValueError("The start config has no outputPath")
+
+    metadata = config.outputMetaData or {}
+    if config.outputType == InputOutputTypes.FILA:
+        url = options.pop("url", metadata.get("url"))
+        if url is None:
+            raise ValueError("Queue outputs need the RabbitMQ 'url' in outputMetaData")
+        options = {**metadata_options(metadata, QueueSink.OPTIONS), **options}
+        sink = QueueSink(url, config.outputPath, **options)
+    elif config.outputType == InputOutputTypes.API:
+        options = {**metadata_options(metadata, HttpSink.OPTIONS), **options}
+        sink = HttpSink(config.outputPath, **options)
+    else:
+        parts = urlsplit(config.outputPath)
+        if parts.scheme in ("ftp", "ftps"):
+            options = {**metadata_options(metadata, FtpSink.OPTIONS), **options}
+            options.pop("host", None)
+            options.setdefault("tls", parts.scheme == "ftps")
+            if parts.username:
+                options.setdefault("user", unquote(parts.username))
+            if parts.password:
+                options.setdefault("password", unquote(parts.password))
+            if parts.port:
+                options.setdefault("port", parts.port)
+            sink = FtpSink(parts.hostname, unquote(parts.path), **options)
+        elif "host" in metadata or "host" in options:
+            options = {**metadata_options(metadata, FtpSink.OPTIONS), **options}
+            sink = FtpSink(path=config.outputPath, **options)
+        else:
+            options = {**metadata_options(metadata, FileSink.OPTIONS), **options}
+            sink = FileSink(config.outputPath, **options)
+
+    if execution is not None:
+        execution.add_sink(sink)
+    return sink
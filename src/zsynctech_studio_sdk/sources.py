@@ -0,0 +1,365 @@
+from zsynctech_studio_sdk.utils import Format, detect_format, metadata_options
+from zsynctech_studio_sdk.models.config import InputOutputTypes
+from zsynctech_studio_sdk import codec
+from typing import TYPE_CHECKING, Any, ContextManager, Iterable, Iterator, Literal, Optional
+from contextlib import contextmanager
+from abc import ABC, abstractmethod
+from urllib.parse import unquote, urlsplit
+from itertools import islice
+import csv
+import io
+
+if TYPE_CHECKING:
+    from zsynctech_studio_sdk.models import Config
+
+
+class InputSource(ABC):
+    """Lazy reader of the input records of an execution
+
+    Records are read one at a time, so inputs of any size are processed in
+    constant memory. An offset is the number of records already processed:
+    passing it back to `records` or `batches` resumes the input after them.
+    """
+
+    @abstractmethod
+    def records(self, offset: int = 0) -> Iterator[Any]:
+        """Reads the records of the input
+
+        Args:
+            offset (int, optional): Number of records to skip. Defaults to 0.
+
+        Returns:
+            Iterator[Any]: The records, in input order
+        """
+
+    def batches(self, size: int = 1000, offset: int = 0) -> Iterator[tuple[int, list]]:
+        """Reads the records of the input in batches of up to `size` records
+
+        Args:
+            size (int, optional): Number of records per batch. Defaults to 1000.
+            offset (int, optional): Number of records to skip. Defaults to 0.
+
+        Returns:
+            Iterator[tuple[int, list]]: Pairs of the offset that resumes the input once the
+            batch is processed and the records of the batch
+        """
+        records = self.records(offset)
+        while batch := list(islice(records, size)):
+            offset += len(batch)
+            yield offset, batch
+
+    @abstractmethod
+    def count(self) -> int:
+        """Counts the records of the input without parsing them
+
+        Returns:
+            int: Number of records, e.g. for `Execution.set_total_task_count`
+        """
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.records()
+
+
+class MemorySource(InputSource):
+    def __init__(self, records: Iterable[Any]):
+        """Input source over records already in memory, a stand-in for the other sources in tests
+
+        Args:
+            records (Iterable[Any]): The records.
+        """
+        self._records = list(records)
+
+    def records(self, offset: int = 0) -> Iterator[Any]:
+        return iter(self._records[offset:])
+
+    def count(self) -> int:
+        return len(self._records)
+
+
+class _LineSource(InputSource):
+    def __init__(self, path: str, format: Optional[Format], encoding: str, delimiter: str):
+        self._path = path
+        self._format = format or detect_format(path)
+        self._encoding = encoding
+        self._delimiter = delimiter
+        if self._format not in ("json", "csv", "text"):
+            raise ValueError(f"Unsupported input format '{self._format}', choose 'json', 'csv' or 'text'")
+
+    @abstractmethod
+    def _lines(self) -> ContextManager[Iterable[str]]:
+        """Opens the input as text lines"""
+
+    def records(self, offset: int = 0) -> Iterator[Any]:
+        with self._lines() as lines:
+            if self._format == "csv":
+                parsed = csv.DictReader(lines, delimiter=self._delimiter)
+                if offset and parsed.fieldnames is not None:
+                    # Skipped as raw rows, a quoted value may span several lines
+                    for _ in islice(filter(None, parsed.reader), offset):
+                        pass
+                yield from parsed
+                return
+
+            # Skipped before parsing, so resuming does not decode the records already processed
+            lines = islice((line for line in lines if line.strip()), offset, None)
+            if self._format == "json":
+                yield from (codec.loads(line) for line in lines)
+            else:
+                yield from (line.rstrip("\r\n") for line in lines)
+
+    def count(self) -> int:
+        with self._lines() as lines:
+            if self._format == "csv":
+                return max(sum(1 for row in csv.reader(lines, delimiter=self._delimiter) if row) - 1, 0)
+            return sum(1 for line in lines if line.strip())
+
+
+class FileSource(_LineSource):
+    OPTIONS = ("format", "encoding", "delimiter")
+
+    def __init__(
+            self,
+            path: str,
+            format: Optional[Format] = None,
+            encoding: str = "utf-8",
+            delimiter: str = ",",
+        ):
+        """Input source that streams a local file
+
+        Args:
+            path (str): File path.
+            format (Optional[Format], optional): "json" for one JSON document per line, "csv"
+            for rows read as dictionaries or "text" for lines. Defaults to the file extension.
+            encoding (str, optional): File encoding. Defaults to "utf-8".
+            delimiter (str, optional): CSV delimiter. Defaults to ",".
+        """
+        super().__init__(path, format, encoding, delimiter)
+
+    @contextmanager
+    def _lines(self) -> Iterator[Iterable[str]]:
+        with open(self._path, encoding=self._encoding, newline="") as file:
+            yield file
+
+
+class FtpSource(_LineSource):
+    OPTIONS = ("host", "user", "password", "port", "tls", "timeout", "format", "encoding", "delimiter")
+
+    def __init__(
+            self,
+            host: str,
+            path: str,
+            user: str = "anonymous",
+            password: str = "",
+            port: int = 21,
+            tls: bool = False,
+            timeout: float = 30.0,
+            format: Optional[Format] = None,
+            encoding: str = "utf-8",
+            delimiter: str = ",",
+        ):
+        """Input source that streams a file from an FTP server, without storing it locally
+
+        Args:
+            host (str): Server host.
+            path (str): File path on the server.
+            user (str, optional): User name. Defaults to "anonymous".
+            password (str, optional): Password. Defaults to "".
+            port (int, optional): Server port. Defaults to 21.
+            tls (bool, optional): Uses FTPS with a protected data connection. Defaults to False.
+            timeout (float, optional): Connection timeout in seconds. Defaults to 30.0.
+            format (Optional[Format], optional): Record format, see `FileSource`. Defaults to the file extension.
+            encoding (str, optional): File encoding. Defaults to "utf-8".
+            delimiter (str, optional): CSV delimiter. Defaults to ",".
+        """
+        super().__init__(path, format, encoding, delimiter)
+        self._host = host
+        self._user = user
+        self._password = password
+        self._port = port
+        self._tls = tls
+        self._timeout = timeout
+
+    @contextmanager
+    def _lines(self) -> Iterator[Iterable[str]]:
+        import ftplib
+
+        ftp = ftplib.FTP_TLS() if self._tls else ftplib.FTP()
+        ftp.connect(self._host, self._port, timeout=self._timeout)
+        try:
+            ftp.login(self._user, self._password)
+            if self._tls:
+                ftp.prot_p()
+            ftp.voidcmd("TYPE I")
+            with ftp.transfercmd(f"RETR {self._path}") as connection:
+                with io.TextIOWrapper(connection.makefile("rb"), encoding=self._encoding, newline="") as file:
+                    yield file
+            ftp.voidresp()
+        finally:
+            ftp.close()
+
+
+class HttpSource(_LineSource):
+    OPTIONS = ("headers", "timeout", "format", "encoding", "delimiter")
+
+    def __init__(
+            self,
+            url: str,
+            headers: Optional[dict] = None,
+            timeout: float = 30.0,
+            format: Optional[Format] = None,
+            encoding: str = "utf-8",
+            delimiter: str = ",",
+        ):
+        """Input source that streams the response body of an HTTP GET
+
+        Args:
+            url (str): Input URL.
+            headers (Optional[dict], optional): Request headers. Defaults to None.
+            timeout (float, optional): Request timeout in seconds. Defaults to 30.0.
+            format (Optional[Format], optional): Record format, see `FileSource`. Defaults to the URL extension.
+            encoding (str, optional): Response encoding. Defaults to "utf-8".
+            delimiter (str, optional): CSV delimiter. Defaults to ",".
+        """
+        super().__init__(url, format, encoding, delimiter)
+        self._headers = headers
+        self._timeout = timeout
+
+    @contextmanager
+    def _lines(self) -> Iterator[Iterable[str]]:
+        import httpx
+
+        with httpx.stream("GET", self._path, headers=self._headers, timeout=self._timeout) as response:
+            response.raise_for_status()
+            response.encoding = self._encoding
+            yield response.iter_lines()
+
+
+class QueueSource(InputSource):
+    OPTIONS = ("format", "encoding", "prefetch", "inactivity_timeout")
+
+    def __init__(
+            self,
+            url: str,
+            queue: str,
+            format: Literal["json", "text"] = "json",
+            encoding: str = "utf-8",
+            prefetch: int = 100,
+            inactivity_timeout: float = 1.0,
+        ):
+        """Input source that consumes the messages of a RabbitMQ queue
+
+        Each message is a record. A message is acknowledged once the record (or the
+        batch it belongs to) is processed, i.e. when the next one is requested, so
+        messages of an interrupted run are delivered again. Acknowledged messages
+        leave the queue, which makes offsets unnecessary: they only count records.
+        The input ends when the queue stays empty for `inactivity_timeout` seconds.
+
+        Args:
+            url (str): RabbitMQ connection URL.
+            queue (str): Queue name.
+            format (Literal["json", "text"], optional): "json" for JSON messages or "text". Defaults to "json".
+            encoding (str, optional): Encoding of text messages. Defaults to "utf-8".
+            prefetch (int, optional): Number of messages delivered ahead. Defaults to 100.
+            inactivity_timeout (float, optional): Time in seconds without messages that ends the input.
+            Defaults to 1.0.
+        """
+        if format not in ("json", "text"):
+            raise ValueError(f"Unsupported queue format '{format}', choose 'json' or 'text'")
+        self._url = url
+        self._queue = queue
+        self._format = format
+        self._encoding = encoding
+        self._prefetch = prefetch
+        self._inactivity_timeout = inactivity_timeout
+
+    @contextmanager
+    def _consume(self, prefetch: int) -> Iterator[tuple[Any, Iterator[tuple[int, Any]]]]:
+        import pika
+
+        connection = pika.BlockingConnection(pika.URLParameters(self._url))
+        try:
+            channel = connection.channel()
+            channel.basic_qos(prefetch_count=prefetch)
+            yield channel, self._messages(channel)
+        finally:
+            # Unacknowledged messages return to the queue
+            if connection.is_open:
+                connection.close()
+
+    def _messages(self, channel) -> Iterator[tuple[int, Any]]:
+        for method, _, body in channel.consume(self._queue, inactivity_timeout=self._inactivity_timeout):
+            if method is None:
+                return
+            yield method.delivery_tag, codec.loads(body) if self._format == "json" else body.decode(self._encoding)
+
+    def records(self, offset: int = 0) -> Iterator[Any]:
+        with self._consume(self._prefetch) as (channel, messages):
+            for delivery_tag, record in messages:
+                yield record
+                channel.basic_ack(delivery_tag)
+
+    def batches(self, size: int = 1000, offset: int = 0) -> Iterator[tuple[int, list]]:
+        # The whole batch must be delivered before any of it is acknowledged
+        with self._consume(max(self._prefetch, size)) as (channel, messages):
+            while deliveries := list(islice(messages, size)):
+                offset += len(deliveries)
+                yield offset, [record for _, record in deliveries]
+                channel.basic_ack(deliveries[-1][0], multiple=True)
+
+    def count(self) -> int:
+        import pika
+
+        connection = pika.BlockingConnection(pika.URLParameters(self._url))
+        try:
+            return connection.channel().queue_declare(self._queue, passive=True).method.message_count
+        finally:
+            connection.close()
+
+
+def open_input(config: "Config", **options: Any) -> InputSource:
+    """Opens the input described by `inputType`, `inputPath` and `inputMetaData` of a start config
+
+    FTP inputs are read from an `ftp://` or `ftps://` URL, or from the `host` in
+    `inputMetaData`, and from the local file system otherwise. Queue inputs need
+    the RabbitMQ `url` in `inputMetaData`. The `inputMetaData` entries that are
+    options of the source, e.g. `format`, `encoding` or `headers`, are passed to
+    it and the others are ignored; `options` override them.
+
+    Args:
+        config (Config): Start configuration of the execution.
+
+    Returns:
+        InputSource: The input source
+    """
+    if not config.inputPath:
+        raise ValueError("The start config has no inputPath")
+
+    metadata = config.inputMetaData or {}
+    if config.inputType == InputOutputTypes.FILA:
+        url = options.pop("url", metadata.get("url"))
+        if url is None:
+            raise ValueError("Queue inputs need the RabbitMQ 'url' in inputMetaData")
+        options = {**metadata_options(metadata, QueueSource.OPTIONS), **options}
+        return QueueSource(url, config.inputPath, **options)
+
+    if config.inputType == InputOutputTypes.API:
+        options = {**metadata_options(metadata, HttpSource.OPTIONS), **options}
+        return HttpSource(config.inputPath, **options)
+
+    parts = urlsplit(config.inputPath)
+    if parts.scheme in ("ftp", "ftps"):
+        options = {**metadata_options(metadata, FtpSource.OPTIONS), **options}
+        options.pop("host", None)
+        options.setdefault("tls", parts.scheme == "ftps")
+        if parts.username:
+            options.setdefault("user", unquote(parts.username))
+        if parts.password:
+            options.setdefault("password", unquote(parts.password))
+        if parts.port:
+            options.setdefault("port", parts.port)
+        return FtpSource(parts.hostname, unquote(parts.path), **options)
+    if "host" in metadata or "host" in options:
+        options = {**metadata_options(metadata, FtpSource.OPTIONS), **options}
+        return FtpSource(path=config.inputPath, **options)
+    options = {**metadata_options(metadata, FileSource.OPTIONS), **options}
+    return FileSource(config.inputPath, **options)
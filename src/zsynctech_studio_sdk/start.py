@@ -1,24 +1,80 @@
 from zsynctech_studio_sdk.utils import validate_id_format
 from zsynctech_studio_sdk.models import Config
-from zsynctech_studio_sdk import client
+from zsynctech_studio_sdk.client import StudioClient, get_client
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Optional
+import pika.exceptions
+import functools
+import random
 import pika
-import json
+import time
 
 EXCHANGE_NAME = "start"
 
+DRAIN_TIMEOUT = 1.0
+
+CONNECTION_ERRORS = (
+    pika.exceptions.AMQPConnectionError,
+    pika.exceptions.AMQPChannelError,
+)
+
 
 class StartService:
-    def __init__(self, rabbitmq_url: str, heartbeat: int = 5400):
-        if client._instance_id is None:
-            raise RuntimeError("Credentials not set. Call set_credentials() first.")
-        self._instance_id = validate_id_format(client._instance_id)
+    def __init__(
+            self,
+            rabbitmq_url: str,
+            heartbeat: int = 5400,
+            client: Optional[StudioClient] = None,
+            reconnect: bool = True,
+            reconnect_backoff_max: float = 30.0,
+            max_reconnect_attempts: Optional[int] = None,
+        ):
+        """Consumer of start events
+
+        When the connection is lost the service reconnects with jittered exponential
+        backoff, declares the exchange, queue and binding again and restores the
+        consumer of the running listener.
+
+        Args:
+            rabbitmq_url (str): RabbitMQ connection url.
+            heartbeat (int, optional): Heartbeat interval in seconds. Defaults to 5400.
+            client (Optional[StudioClient], optional): Client of the robot instance. Defaults to None.
+            reconnect (bool, optional): Reconnects automatically when the connection is lost. Defaults to True.
+            reconnect_backoff_max (float, optional): Maximum time in seconds between reconnect
+            attempts. Defaults to 30.0.
+            max_reconnect_attempts (Optional[int], optional): Consecutive failed attempts before
+            giving up and raising, None retries forever. Defaults to None.
+        """
+        self._instance_id = validate_id_format(get_client(client).instance_id)
         self._queue_name = f"robot_{self._instance_id}"
-        self._connection = pika.BlockingConnection(
-            parameters=pika.URLParameters(
-                f"{rabbitmq_url}?heartbeat={heartbeat}"
-            )
-        )
+        self._parameters = pika.URLParameters(f"{rabbitmq_url}?heartbeat={heartbeat}")
+        self._reconnect_enabled = reconnect
+        self._reconnect_backoff_max = reconnect_backoff_max
+        self._max_reconnect_attempts = max_reconnect_attempts
+        self._closed = False
+        self._reconnects = 0
+        self._downtime_total = 0.0
+        self._downtime_last = 0.0
+        self._connection = None
+        self._channel = None
+        self._batch_channel = None
+        self._connect()
+
+    @property
+    def metrics(self) -> dict[str, float]:
+        """Connection recovery counters
+
+        Returns:
+            dict[str, float]: Number of reconnections, plus total and last downtime in seconds
+        """
+        return {
+            "reconnects": self._reconnects,
+            "downtime_total": self._downtime_total,
+            "downtime_last": self._downtime_last,
+        }
+
+    def _connect(self):
+        self._connection = pika.BlockingConnection(parameters=self._parameters)
         self._channel = self._connection.channel()
 
         self._channel.exchange_declare(
@@ -36,6 +92,52 @@ class StartService:
             routing_key=f"instance.{self._instance_id}"
         )
 
+    def _reconnect(self, error: Exception):
+        if not self._reconnect_enabled or self._closed:
+            raise error
+
+        lost_at = time.monotonic()
+        print(f"[StartService] Connection lost: {error!r}. Reconnecting...")
+        attempt = 0
+        while True:
+            try:
+                if self._connection is not None and not self._connection.is_closed:
+                    self._connection.close()
+            except Exception:
+                pass
+
+            attempt += 1
+            try:
+                self._connect()
+                break
+            except CONNECTION_ERRORS as e:
+                if self._max_reconnect_attempts is not None and attempt >= self._max_reconnect_attempts:
+                    raise
+                delay = random.uniform(0, min(self._reconnect_backoff_max, 2 ** (attempt - 1)))
+                print(f"[StartService] Reconnect attempt {attempt} failed, retrying in {delay:.1f}s: {e!r}")
+                time.sleep(delay)
+
+        self._downtime_last = time.monotonic() - lost_at
+        self._downtime_total += self._downtime_last
+        self._reconnects += 1
+        print(f"[StartService] Reconnected after {self._downtime_last:.1f}s.")
+
+    def _consume(self, setup_consumer: Callable[[], None]):
+        while True:
+            setup_consumer()
+            try:
+                self._channel.start_consuming()
+                return
+            except KeyboardInterrupt:
+                self.close()
+                return
+            except CONNECTION_ERRORS as e:
+                self._reconnect(e)
+
+    @staticmethod
+    def _parse_config(body: bytes) -> Config:
+        return Config.model_validate_json(body)
+
     def get_start_config(self) -> Optional[Config]:
         """Checks if there are start events in the queue
 
@@ -43,17 +145,115 @@ class StartService:
             Optional[Config]: Returns the configuration json, 
             if the queue is empty it returns None
         """
-        method_frame, _, body = self._channel.basic_get(
+        try:
+            method_frame, _, body = self._channel.basic_get(
+                queue=self._queue_name,
+                auto_ack=True
+            )
+        except CONNECTION_ERRORS as e:
+            self._reconnect(e)
+            method_frame, _, body = self._channel.basic_get(
+                queue=self._queue_name,
+                auto_ack=True
+            )
+        if method_frame:
+            return self._parse_config(body)
+        return None
+
+    def get_start_configs(self, max_n: int = 100, window: float = 0.0) -> list[tuple[int, Config]]:
+        """Pulls up to `max_n` start events in a single pass
+
+        The events are pushed by the broker at once instead of fetched one by one,
+        and stay unacknowledged until `ack` is called with their delivery tags.
+        Invalid events are discarded.
+
+        Args:
+            max_n (int, optional): Maximum number of events. Defaults to 100.
+            window (float, optional): Time in seconds to keep collecting events that
+            arrive after the call, 0 returns only the events already in the queue. Defaults to 0.0.
+
+        Returns:
+            list[tuple[int, Config]]: Delivery tag and configuration of each event, in queue order
+        """
+        try:
+            return self._drain(max_n, window)
+        except CONNECTION_ERRORS as e:
+            self._reconnect(e)
+            return self._drain(max_n, window)
+
+    def _drain(self, max_n: int, window: float) -> list[tuple[int, Config]]:
+        pending = self._channel.queue_declare(
+            queue=self._queue_name,
+            durable=True,
+            passive=True
+        ).method.message_count
+        target = max_n if window > 0 else min(max_n, pending)
+        if not target:
+            return []
+
+        deliveries = []
+
+        def _internal_callback(ch, method, properties, body):
+            deliveries.append((method.delivery_tag, body))
+
+        self._batch_channel = self._channel
+        self._channel.basic_qos(prefetch_count=target)
+        consumer_tag = self._channel.basic_consume(
             queue=self._queue_name,
-            auto_ack=True
+            on_message_callback=_internal_callback,
+            auto_ack=False
         )
-        if method_frame:
+        deadline = time.monotonic() + (window or DRAIN_TIMEOUT)
+        while len(deliveries) < target:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            self._connection.process_data_events(time_limit=remaining)
+        self._channel.basic_cancel(consumer_tag)
+
+        configs = []
+        for delivery_tag, body in deliveries:
             try:
-                message = json.loads(body)
-            except json.JSONDecodeError:
-                message = body.decode()
-            return Config(**message)
-        return None
+                configs.append((delivery_tag, self._parse_config(body)))
+            except Exception as e:
+                print(f"[StartService] Discarding invalid event: {e}")
+                self._channel.basic_reject(delivery_tag=delivery_tag, requeue=False)
+        return configs
+
+    def ack(self, delivery_tag: int, multiple: bool = False) -> bool:
+        """Acknowledges events returned by `get_start_configs`
+
+        Args:
+            delivery_tag (int): Delivery tag of the event.
+            multiple (bool, optional): Also acknowledges every earlier event. Defaults to False.
+
+        Returns:
+            bool: False if the connection was lost since the events were received,
+            in which case the broker delivers them again
+        """
+        if self._batch_channel is not self._channel or not self._channel.is_open:
+            print("[StartService] Connection was reset, unacknowledged events will be redelivered.")
+            return False
+        self._channel.basic_ack(delivery_tag=delivery_tag, multiple=multiple)
+        return True
+
+    def nack(self, delivery_tag: int, multiple: bool = False, requeue: bool = True) -> bool:
+        """Returns events received by `get_start_configs` to the queue, or discards them
+
+        Args:
+            delivery_tag (int): Delivery tag of the event.
+            multiple (bool, optional): Also rejects every earlier event. Defaults to False.
+            requeue (bool, optional): Returns the events to the queue instead of discarding them. Defaults to True.
+
+        Returns:
+            bool: False if the connection was lost since the events were received,
+            in which case the broker delivers them again
+        """
+        if self._batch_channel is not self._channel or not self._channel.is_open:
+            print("[StartService] Connection was reset, unacknowledged events will be redelivered.")
+            return False
+        self._channel.basic_nack(delivery_tag=delivery_tag, multiple=multiple, requeue=requeue)
+        return True
 
     def start_listener(self, callback: Callable):
         """Starts a consumer to check for start events
@@ -63,26 +263,88 @@ class StartService:
             called when there is an event.
         """
         def _internal_callback(ch, method, properties, body):
-            try:
-                message = json.loads(body)
-            except json.JSONDecodeError:
-                message = body.decode()
-            callback(Config(**message))
+            callback(self._parse_config(body))
 
-        self._channel.basic_consume(
-            queue=self._queue_name,
-            on_message_callback=_internal_callback,
-            auto_ack=True
+        def _setup_consumer():
+            self._channel.basic_consume(
+                queue=self._queue_name,
+                on_message_callback=_internal_callback,
+                auto_ack=True
+            )
+            print(f"[StartService] Waiting for events in queue: {self._queue_name}...")
+
+        self._consume(_setup_consumer)
+
+    def start_concurrent_listener(
+            self,
+            callback: Callable,
+            prefetch_count: int = 1,
+            max_workers: Optional[int] = None,
+            requeue_on_error: bool = False,
+        ):
+        """Starts a consumer that runs each start event on a worker pool
+
+        Up to `prefetch_count` events are delivered at once and each one is
+        acknowledged only after its callback returns, so an event is redelivered
+        if the robot crashes while processing it. The connection keeps processing
+        heartbeats while the callbacks run. Events still unacknowledged when the
+        connection is lost are redelivered once the service reconnects.
+
+        Args:
+            callback (Callable): Function that will be
+            called when there is an event.
+            prefetch_count (int, optional): Maximum number of unacknowledged events. Defaults to 1.
+            max_workers (Optional[int], optional): Number of worker threads. Defaults to `prefetch_count`.
+            requeue_on_error (bool, optional): Returns the event to the queue when
+            the callback raises, instead of discarding it. Defaults to False.
+        """
+        pool = ThreadPoolExecutor(
+            max_workers=max_workers or prefetch_count,
+            thread_name_prefix="zsynctech-start"
         )
 
-        print(f"[StartService] Waiting for events in queue: {self._queue_name}...")
+        def _settle(channel, delivery_tag: int, success: bool):
+            if not channel.is_open:
+                return
+            if success:
+                channel.basic_ack(delivery_tag=delivery_tag)
+            else:
+                channel.basic_nack(delivery_tag=delivery_tag, requeue=requeue_on_error)
+
+        def _work(connection, channel, delivery_tag: int, body: bytes):
+            success = False
+            try:
+                callback(self._parse_config(body))
+                success = True
+            except Exception as e:
+                print(f"[StartService] Error processing event: {e}")
+            finally:
+                try:
+                    connection.add_callback_threadsafe(
+                        functools.partial(_settle, channel, delivery_tag, success)
+                    )
+                except CONNECTION_ERRORS:
+                    print("[StartService] Connection lost before the event was settled, it will be redelivered.")
+
+        def _internal_callback(ch, method, properties, body):
+            pool.submit(_work, self._connection, ch, method.delivery_tag, body)
+
+        def _setup_consumer():
+            self._channel.basic_qos(prefetch_count=prefetch_count)
+            self._channel.basic_consume(
+                queue=self._queue_name,
+                on_message_callback=_internal_callback,
+                auto_ack=False
+            )
+            print(f"[StartService] Waiting for events in queue: {self._queue_name} (prefetch {prefetch_count})...")
 
         try:
-            self._channel.start_consuming()
-        except KeyboardInterrupt:
-            self.close()
+            self._consume(_setup_consumer)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
 
     def close(self):
+        self._closed = True
         if self._connection and not self._connection.is_closed:
             self._connection.close()
             print("[StartService] Connection closed.")
@@ -1,8 +1,9 @@
 from zsynctech_studio_sdk.utils import get_utc_now
 from zsynctech_studio_sdk.models import StepModel
 from zsynctech_studio_sdk.enums import StepStatus
-from zsynctech_studio_sdk import client
+from zsynctech_studio_sdk.client import StudioClient, get_client
 from typing import Optional
+import time
 
 
 STEP_STATUS_COMPLETED = [
@@ -12,36 +13,68 @@ STEP_STATUS_COMPLETED = [
 
 
 class Step(StepModel):
-    def __init__(self, task_id: str, code: str, observation: Optional[str] = None):
-        self._current_step = StepModel(
+    def __init__(
+            self,
+            task_id: str,
+            code: str,
+            observation: Optional[str] = None,
+            client: Optional[StudioClient] = None,
+        ):
+        self._client = get_client(client)
+        self._current_step = StepModel.build(
+            trusted=dict(startDate=get_utc_now()),
             stepCode=code,
             taskId=task_id,
-            startDate=get_utc_now(),
             observation=observation,
-            automationOnClientId=client._instance_id
+            automationOnClientId=self._client.instance_id
         )
         self._resource_path = "taskSteps"
+        self._started = time.monotonic_ns()
+        self._profile = None
 
-    def _update(
+    def _apply(
             self,
             status: Optional[StepStatus] = None,
             observation: Optional[str] = None,
         ) -> dict:
         if status in STEP_STATUS_COMPLETED:
-            self._current_step.endDate = get_utc_now()
+            self._current_step.set_trusted(endDate=get_utc_now())
 
         if observation is not None:
             self._current_step.observation = observation
         
         if status is not None:
-            self._current_step.status = status
+            self._instrument(status)
+            self._current_step.set_trusted(status=status)
+
+        return self._current_step.dump()
+
+    def _instrument(self, status: StepStatus):
+        instrumentation = self._client.instrumentation
+        if instrumentation is None:
+            return
+        if status in STEP_STATUS_COMPLETED and self._current_step.status not in STEP_STATUS_COMPLETED:
+            instrumentation.record(
+                "step",
+                self._current_step.id,
+                status,
+                self._started,
+                parent_id=self._current_step.taskId,
+                code=self._current_step.stepCode
+            )
 
-        client.post(
+    def _update(
+            self,
+            status: Optional[StepStatus] = None,
+            observation: Optional[str] = None,
+        ) -> dict:
+        self._client.submit(
             endpoint=f"{self._resource_path}",
-            json=self._current_step.model_dump()
+            json=self._apply(status, observation),
+            must_deliver=status in STEP_STATUS_COMPLETED
         )
 
-        return self._current_step.model_dump()
+        return dict(self._current_step.dump())
     
     def _start(self, observation: Optional[str] = None) -> dict:
         """Updates the step status to running
@@ -76,15 +109,34 @@ class Step(StepModel):
         """
         return self._update(status=StepStatus.SUCCESS, observation=observation)
 
+    def _start_profile(self):
+        step_profiler = self._client.step_profiler
+        if step_profiler is not None:
+            self._profile = (step_profiler, step_profiler.start(self._current_step.id, self._current_step.stepCode))
+
+    def _stop_profile(self, observation: Optional[str]) -> Optional[str]:
+        """Stops the profile of the step, adding its path to the observation if configured"""
+        if self._profile is None:
+            return observation
+        step_profiler, session = self._profile
+        self._profile = None
+        profile_path = step_profiler.stop(session)
+        if profile_path is not None and step_profiler.annotate_observation:
+            observation = f"{observation} (perfil: {profile_path})" if observation else f"Perfil: {profile_path}"
+        return observation
+
     def __enter__(self):
         self._start()
+        self._start_profile()
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
+        observation = self._stop_profile(str(exc_value) if exc_type is not None else None)
+
         if self._current_step.status not in STEP_STATUS_COMPLETED:
             if exc_type is not None:
-                self.fail(observation=str(exc_value))
+                self.fail(observation=observation)
             else:
-                self.success()
+                self.success(observation=observation)
 
         return False
\ No newline at end of file
@@ -1,9 +1,10 @@
 from zsynctech_studio_sdk.utils import get_utc_now
 from zsynctech_studio_sdk.models import TaskModel
 from zsynctech_studio_sdk.enums import TaskStatus
-from zsynctech_studio_sdk import client
+from zsynctech_studio_sdk.client import StudioClient, get_client
 from uuid_extensions import uuid7
 from typing import Optional
+import time
 
 
 TASK_STATUS_COMPLETED = [
@@ -14,47 +15,71 @@ TASK_STATUS_COMPLETED = [
 
 
 class Task:
-    def __init__(self, execution_id: str, code: Optional[str] = None, description: Optional[str] = None):
-        self._current_task = TaskModel(
+    def __init__(
+            self,
+            execution_id: str,
+            code: Optional[str] = None,
+            description: Optional[str] = None,
+            client: Optional[StudioClient] = None,
+        ):
+        self._current_task = TaskModel.build(
+            trusted=dict(startDate=get_utc_now()),
             executionId=execution_id,
-            startDate=get_utc_now()
+            code=code or str(uuid7()),
+            description=description or "Descrição não informada",
         )
         self._resource_path = "tasks"
+        self._client = client
+        self._started = time.monotonic_ns()
 
-        if code:
-            self._current_task.code = code
-        else:
-            self._current_task.code = str(uuid7())
-
-        if description:
-            self._current_task.description = description
-        else:
-            self._current_task.description = "Descrição não informada"
-        
     @property
     def task_id(self):
         return self._current_task.id
     
-    def _update(
+    def _apply(
             self,
             status: Optional[TaskStatus] = None,
             observation: Optional[str] = None,
         ) -> dict:
         if status in TASK_STATUS_COMPLETED:
-            self._current_task.endDate = get_utc_now()
+            self._current_task.set_trusted(endDate=get_utc_now())
 
         if status is not None:
-            self._current_task.status = status
+            self._instrument(status)
+            self._current_task.set_trusted(status=status)
     
         if observation is not None:
             self._current_task.observation = observation
 
-        client.post(
+        return self._current_task.dump()
+
+    def _instrument(self, status: TaskStatus):
+        instrumentation = get_client(self._client).instrumentation
+        if instrumentation is None:
+            return
+        if status == TaskStatus.RUNNING:
+            instrumentation.link(self._current_task.id, self._current_task.executionId)
+        elif status in TASK_STATUS_COMPLETED and self._current_task.status not in TASK_STATUS_COMPLETED:
+            instrumentation.record(
+                "task",
+                self._current_task.id,
+                status,
+                self._started,
+                parent_id=self._current_task.executionId
+            )
+
+    def _update(
+            self,
+            status: Optional[TaskStatus] = None,
+            observation: Optional[str] = None,
+        ) -> dict:
+        get_client(self._client).submit(
             endpoint=self._resource_path,
-            json=self._current_task.model_dump()
+            json=self._apply(status, observation),
+            must_deliver=status in TASK_STATUS_COMPLETED
         )
 
-        return self._current_task.model_dump()
+        return dict(self._current_task.dump())
 
     def start(self, observation: Optional[str] = None) -> dict:
         """Updates the task status to running
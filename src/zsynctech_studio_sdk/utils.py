@@ -1,5 +1,12 @@
+from zsynctech_studio_sdk.validation import validate_uuid7
 from datetime import datetime, timezone
-import re
+from typing import Literal, Optional
+from urllib.parse import urlsplit
+import os
+
+Format = Literal["json", "csv", "text"]
+
+JSON_EXTENSIONS = (".jsonl", ".ndjson")
 
 
 def get_utc_now() -> str:
@@ -13,9 +20,19 @@ def get_utc_now() -> str:
 
 
 def validate_id_format(v):
-    if not re.match(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', v):
-        raise ValueError('ID deve ser um UUID válido')
-    version = int(v[14], 16)
-    if version != 7:
-        raise ValueError('ID deve ser um UUID7 válido')
-    return v
\ No newline at end of file
+    return validate_uuid7(v)
+
+
+def detect_format(path: str) -> Format:
+    """Record format of an input or output file, from its extension"""
+    extension = os.path.splitext(urlsplit(path).path)[1].lower()
+    if extension in JSON_EXTENSIONS:
+        return "json"
+    if extension == ".csv":
+        return "csv"
+    return "text"
+
+
+def metadata_options(metadata: Optional[dict], accepted: tuple[str, ...]) -> dict:
+    """Keeps the metadata entries that are options of the source or sink, ignoring the others"""
+    return {name: value for name, value in (metadata or {}).items() if name in accepted}
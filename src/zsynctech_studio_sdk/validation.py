@@ -0,0 +1,38 @@
+from datetime import datetime
+from functools import lru_cache
+import re
+
+UUID_PATTERN = re.compile(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}')
+ISO_TIMESTAMP_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z')
+
+
+@lru_cache(maxsize=4096)
+def validate_uuid7(v: str) -> str:
+    """Validates that the value is a lowercase UUID version 7
+
+    Results are cached, so ids shared by many entities, such as the
+    `executionId` of every task, are only checked once.
+
+    Raises:
+        ValueError: The value is not a UUID7.
+    """
+    if not isinstance(v, str) or not UUID_PATTERN.fullmatch(v):
+        raise ValueError('ID deve ser um UUID válido')
+    if v[14] != '7':
+        raise ValueError('ID deve ser um UUID7 válido')
+    return v
+
+
+def validate_iso_timestamp(v: str, field_name: str) -> str:
+    """Validates a UTC timestamp in the `YYYY-MM-DDTHH:MM:SS.mmmZ` format
+
+    Raises:
+        ValueError: The value is not in the format or is not a valid date.
+    """
+    if not ISO_TIMESTAMP_PATTERN.fullmatch(v):
+        raise ValueError(f'{field_name} deve estar no formato ISO 8601 com Z')
+    try:
+        datetime.fromisoformat(v)
+    except ValueError:
+        raise ValueError(f'{field_name} deve ser uma data válida')
+    return v